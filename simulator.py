@@ -1,18 +1,34 @@
 # simulator.py
 # Suggestion: Install Faker for realistic data -> pip install Faker
 
+import argparse
 import json
-import uuid
-import requests # Although not sending yet, keep for future use
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import random
+from bisect import bisect
 import time
-from datetime import datetime, timedelta
+from functools import lru_cache
 from faker import Faker
-from typing import Any, Dict, Optional, List
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, Optional, List, Tuple
 from pathlib import Path
 import logging
+import math
 import re
+import select
+import sys
 import os
+import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from itertools import compress
+from contextlib import contextmanager, nullcontext
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder/decoder
+    orjson = None
 
 # Configure logging for the application
 logging.basicConfig(
@@ -22,20 +38,448 @@ logging.basicConfig(
 )
 
 fake = Faker()  # Initialize Faker
+# Feeds the batch-run Faker pools only: unweighted locale data is much faster to sample
+_pool_fake = Faker(use_weighting=False)
+
+class FakerPool:
+    """Serves Faker values from bounded pools that fill on first use and are sampled afterwards.
+
+    Any provider of the wrapped Faker can be called on the pool (``pool.user_name()``); each
+    distinct call signature gets its own pool of up to ``size`` generated values.
+    """
+    def __init__(self, faker: Faker, size: int = 1000) -> None:
+        self._faker = faker
+        self._pools: Dict[Tuple[Any, ...], List[Any]] = {}
+        self.size = size
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        provider = getattr(self._faker, name)
+        pools = self._pools
+        size = self.size
+
+        def draw(*args: Any, **kwargs: Any) -> Any:
+            pool = pools.setdefault((name, args, tuple(sorted(kwargs.items()))), [])
+            if len(pool) < size:
+                value = provider(*args, **kwargs)
+                pool.append(value)
+                return value
+            return random.choice(pool)
+
+        setattr(self, name, draw)  # Later lookups find the attribute and skip __getattr__
+        return draw
+
+class BackgroundSender:
+    """Sends events from a worker thread so the caller never waits on the network.
+
+    Events are handed over through a bounded queue (``submit`` blocks only once ``maxsize``
+    events are waiting) and posted one at a time in submission order. ``close`` waits
+    until everything queued has been sent.
+    """
+    def __init__(self, send: Callable[[Dict[str, Any]], None], maxsize: int = 1000) -> None:
+        self._send = send
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize)
+        self._worker = threading.Thread(target=self._run, name="crc-event-sender", daemon=True)
+        self._worker.start()
+
+    def submit(self, event: Dict[str, Any]) -> None:
+        self._queue.put(event)
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._worker.join()
+
+    def _run(self) -> None:
+        while True:
+            event = self._queue.get()
+            if event is None:
+                return
+            try:
+                self._send(event)
+            except Exception as e:  # Keep draining the queue whatever one send does
+                logging.error(f"Background send failed: {e}")
 
 DEFAULT_CONFIG_PATH = Path(__file__).parent / "default_config.json"
 
+# Value tables for the event builders, hoisted so they are not rebuilt on every event.
+# Weighted picks use cumulative weights and a bisect lookup (see _weighted_choice).
+_SEVERITIES = ("Low", "Medium", "High", "Critical")
+_SIEM_RULES = ("FW-Policy-Violation", "Malware-Detected", "Anomalous-Login", "Data-Exfiltration")
+_SIEM_RESOURCE_KINDS = ("users", "data", "config")
+_PROTOCOLS = ("TCP", "UDP", "ICMP")
+_COMMON_PORTS = (80, 443, 22, 3389, 53)
+_DEVICE_ACTIONS = ("Allowed", "Blocked", "Logged", "Alerted")
+_LOGIN_STATUSES = ("Success", "Failure")
+_LOGIN_STATUS_CUM_WEIGHTS = (85, 100)
+_AUTH_METHODS = ("Password", "MFA", "SSO", "API Key")
+_FENCE_STATUSES = ("Breached", "Secure", "Tamper Detected", "Low Battery")
+_FENCE_STATUS_CUM_WEIGHTS = (60, 90, 95, 100)
+_FENCE_ZONES = ("North Perimeter", "East Gate", "Warehouse Sector", "Restricted Zone")
+_FENCE_ALERT_TYPES = ("Climb Attempt", "Fence Cut", "Tamper Detected", "Impact Detected", "Zone Entry")
+_LOCATION_KINDS = ("Building", "Site", "Area")
+_LOCATION_TRIGGERS = ("Geofence Entry", "Geofence Exit", "Panic Button", "Man Down Alert", "Asset Movement")
+_MOTION_STATUSES = ("Detected", "Clear")
+_MOTION_STATUS_CUM_WEIGHTS = (70, 100)
+_MOTION_AREAS = ("Corridor", "Office", "Entrance", "Storage")
+_SENSITIVITY_LEVELS = ("Low", "Medium", "High")
+_IR_STATUSES = ("Detected", "Clear", "Obscured")
+_IR_STATUS_CUM_WEIGHTS = (65, 95, 100)
+_IR_AREAS = ("Main Gate", "Window", "Passageway", "Secure Entry")
+
+# Event type -> name of the CRCSimulator method generating its payload. Bound once per
+# instance, after any providers passed to the constructor have been applied.
+_EVENT_GENERATORS = {
+    "SIEM_Alert": "_get_siem_alert_details",
+    "Login_Alert": "_get_login_alert_details",
+    "Smart_Fence_Alert": "_get_smart_fence_alert_details",
+    "Location_Based_Alert": "_get_location_based_alert_details",
+    "Motion_Sensor_Alert": "get_motion_sensor_alert_details",
+    "IR_Sensor_Alert": "_get_ir_sensor_alert_details",
+}
+
+@lru_cache(maxsize=None)
+def _casefold_index(values: Tuple[str, ...]) -> Dict[str, str]:
+    """Map the casefolded form of each allowed value back to its canonical spelling."""
+    return {value.casefold(): value for value in values}
+
+def _normalize_choice(raw: str, allowed: Tuple[str, ...], default: str, what: Optional[str] = None) -> str:
+    """Match typed input against allowed values ignoring case and surrounding spaces.
+
+    Empty or unknown input gives the default; when ``what`` names the field, that is logged.
+    """
+    value = _casefold_index(allowed).get(raw.strip().casefold())
+    if value is None:
+        if what:
+            logging.warning(f"Invalid or empty {what}. Using default: {default}.")
+        return default
+    return value
+
+@lru_cache(maxsize=None)
+def _lorem_words() -> Tuple[str, ...]:
+    """Faker's lorem word list for the current locale, loaded once."""
+    return tuple(fake.get_words_list())
+
+def _sentence(nb_words: int) -> str:
+    """A Faker-style lorem sentence: nb_words random words, capitalized, ending in a period.
+
+    Sampling the cached word list directly skips Faker's per-call provider machinery.
+    """
+    text = " ".join(random.choices(_lorem_words(), k=nb_words))
+    return text[:1].upper() + text[1:] + "."
+
+def _destination_port() -> int:
+    """One of the common ports or, with the same odds as each of them, a random high port.
+
+    The high port is only drawn when it is the one picked, and no tuple is built per call.
+    """
+    slot = random.randrange(len(_COMMON_PORTS) + 1)
+    return _COMMON_PORTS[slot] if slot < len(_COMMON_PORTS) else random.randint(1024, 65535)
+
+def _weighted_choice(values: Tuple[Any, ...], cum_weights: Tuple[int, ...]) -> Any:
+    """Pick one value using precomputed cumulative weights: one random() and one bisect,
+    without the per-call setup random.choices does."""
+    return values[bisect(cum_weights, random.random() * cum_weights[-1])]
+
+# Raw bytes of the JSON files read so far: path -> (mtime_ns, size, bytes)
+_CONFIG_CACHE: Dict[str, Tuple[int, int, bytes]] = {}
+
+def _remember_json_file(path: Path, data: bytes) -> None:
+    """Record bytes just written to path, so the next read of it needs no disk access."""
+    st = path.stat()
+    _CONFIG_CACHE[str(path)] = (st.st_mtime_ns, st.st_size, data)
+
+def _file_holds(path: Path, data: bytes) -> bool:
+    """True if path is known, from its cached bytes and unchanged stat, to contain exactly data."""
+    cached = _CONFIG_CACHE.get(str(path))
+    if cached is None or cached[1] != len(data) or cached[2] != data:
+        return False
+    try:
+        st = path.stat()
+    except OSError:
+        return False
+    return cached[:2] == (st.st_mtime_ns, st.st_size)
+
+def _read_json_file(path: Path) -> Any:
+    """Parse a JSON file, re-reading it only when its mtime or size changed.
+
+    The bytes are cached rather than the parsed result: parsing them again is several
+    times cheaper than deep-copying a cached dict, and every caller gets its own objects.
+    """
+    st = path.stat()
+    cached = _CONFIG_CACHE.get(str(path))
+    if cached is None or cached[:2] != (st.st_mtime_ns, st.st_size):
+        cached = _CONFIG_CACHE[str(path)] = (st.st_mtime_ns, st.st_size, path.read_bytes())
+    return _json_loads(cached[2])
+
+# Buffered batch output is written to stdout once this many events have accumulated
+_OUTPUT_FLUSH_EVERY = 100
+
+def _write_stdout(data: bytes) -> None:
+    """Write already-encoded output to stdout in a single call instead of line by line."""
+    sys.stdout.flush()
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is not None:
+        buffer.write(data)
+        buffer.flush()
+    else:
+        sys.stdout.write(data.decode())
+
+def _prompt(message: str) -> str:
+    """Read one line of user input; piped stdin is read directly instead of through input()."""
+    if sys.stdin is not sys.__stdin__ or sys.stdin.isatty():
+        return input(message)
+    sys.stdout.write(message)
+    sys.stdout.flush()  # The prompt must be out before we block on the answer
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+def _interactive_stdin() -> bool:
+    """True if stdin is the process's own terminal (not a pipe, file or replaced stream)."""
+    return sys.stdin is sys.__stdin__ and sys.stdin.isatty() and os.name != "nt"
+
+def _wait_for_stop(delay: float) -> bool:
+    """Wait delay seconds, returning True early if 'stop' is typed at the terminal.
+
+    Only a terminal is watched: lines of piped input belong to the menus that follow.
+    Windows cannot select() on stdin, so there the delay is a plain sleep.
+    """
+    if not _interactive_stdin():
+        time.sleep(delay)
+        return False
+    deadline = time.monotonic() + delay
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        readable, _, _ = select.select([sys.stdin], [], [], remaining)
+        if readable and sys.stdin.readline().strip().lower() == "stop":
+            return True
+
+# Largest number of events sent in one bulk request
+_BULK_CHUNK = 500
+
+def _format_event_block(event_type: str, full_event: Dict[str, Any]) -> bytes:
+    """An event as printed: a header line, the indented JSON and a matching divider."""
+    divider = "-" * 20
+    return (f"{divider} Event Generated ({event_type}) {divider}\n".encode() + _json_dumps(full_event)
+            + b"\n" + b"-" * (42 + len(event_type)) + b"\n")
+
+# Maps a random hex digit onto the RFC 4122 variant digits (8, 9, a, b)
+_UUID_VARIANT = {digit: "89ab"[int(digit, 16) & 3] for digit in "0123456789abcdef"}
+
+# Hex digits of pre-drawn random UUID bodies (32 per entry), refilled 4096 at a time
+_UUID_HEX_POOL: List[str] = []
+
+if hasattr(os, "register_at_fork"):  # A forked child must not hand out the parent's UUIDs
+    os.register_at_fork(after_in_child=_UUID_HEX_POOL.clear)
+
+def _refill_uuid_pool() -> None:
+    """Draw the randomness for 4096 UUIDs with a single os.urandom call."""
+    h = os.urandom(16 * 4096).hex()
+    _UUID_HEX_POOL.extend([h[i:i + 32] for i in range(0, len(h), 32)])
+
+def _fast_uuid4() -> str:
+    """Random version-4 UUID string, formatted directly from os.urandom bytes.
+
+    Equivalent to str(uuid.uuid4()) without building a UUID object per call. The random
+    bytes are drawn in bulk; list.pop is atomic, so concurrent callers never share one.
+    """
+    try:
+        h = _UUID_HEX_POOL.pop()
+    except IndexError:
+        _refill_uuid_pool()
+        h = _UUID_HEX_POOL.pop()
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{_UUID_VARIANT[h[16]]}{h[17:20]}-{h[20:]}"
+
+@lru_cache(maxsize=4096)
+def _parse_number(value: str) -> Optional[float]:
+    """float(value), or None if it is not a number; memoized, as checks see the same few values."""
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+def _fail_validation(message: str) -> None:
+    """Log a field validation error and raise it as ValueError."""
+    logging.error(message)
+    raise ValueError(message)
+
+_PAGE_SIZE = 20  # Rows shown per page in interactive item listings
+
+def _item_number(item: Dict[str, Any]) -> Optional[int]:
+    """Numeric part of an item ID such as ``MOT-012`` (None when the ID has no trailing number)."""
+    digits = str(item.get("id", "")).rpartition("-")[2]
+    return int(digits) if digits.isdigit() else None
+
+def _format_item_summary(item: Dict[str, Any]) -> str:
+    """One-line item description with raw field names, as shown in selection lists."""
+    return f"ID: {item['id']}, " + ", ".join(f"{k}: {v}" for k, v in item.items() if k != "id")
+
+def _format_item_details(item: Dict[str, Any]) -> str:
+    """One-line item description with title-cased field names, as shown in listings."""
+    return f"ID: {item['id']}, " + ", ".join(f"{k.replace('_', ' ').title()}: {v}" for k, v in item.items() if k != "id")
+
+@lru_cache(maxsize=32)
+def _numbered_menu(names: Tuple[str, ...]) -> str:
+    """Render a numbered list of names once per distinct tuple of names."""
+    return "\n".join(f"{i}. {name}" for i, name in enumerate(names, 1))
+
+@lru_cache(maxsize=32)
+def _choice_index(names: Tuple[str, ...]) -> Dict[str, str]:
+    """Map each menu number and name to the name it selects; numbers win over names."""
+    index = {name: name for name in names}
+    index.update((str(i), name) for i, name in enumerate(names, 1))
+    return index
+
+def _select_name(names: Tuple[str, ...], message: str, what: str) -> Optional[str]:
+    """Prompt for a name from a numbered list; None on 'back' or an invalid choice."""
+    choice = _prompt(message).strip()
+    if choice.lower() == 'back':
+        return None
+    selected = _choice_index(names).get(choice)
+    if selected is None:
+        print("Invalid number." if choice.isdigit() else f"Invalid {what}.")
+    return selected
+
+def _parse_fields(raw: str) -> List[str]:
+    """Split comma-separated field names, stripping each once and dropping blanks and repeats."""
+    return list(dict.fromkeys(filter(None, map(str.strip, raw.split(",")))))
+
+def _parse_bound(raw: str) -> float:
+    """Parse a range bound typed at the prompt, keeping whole numbers as int."""
+    try:
+        return int(raw)
+    except ValueError:
+        value = float(raw)
+    if not math.isfinite(value):  # Not representable in the JSON config
+        raise ValueError(f"bound must be finite: {raw!r}")
+    return value
+
+def _format_threshold(threshold: Any) -> str:
+    """Describe a threshold the way the thresholds menu lists it."""
+    if isinstance(threshold, dict) and "min" in threshold and "max" in threshold:
+        return f"{threshold['min']} to {threshold['max']}"
+    if isinstance(threshold, list):
+        return "one of " + ", ".join(map(str, threshold))
+    return f"exactly {threshold}"
+
+def _match_setting(settings: Dict[str, Any], name: str) -> Optional[str]:
+    """Find a setting by exact name, else ignoring case; None if there is no such setting."""
+    if name in settings:
+        return name
+    # Misses only: the index is rebuilt from the current settings, which the menu may have changed
+    return {key.casefold(): key for key in settings}.get(name.casefold())
+
+_TRUTHY = frozenset(("true", "1", "t", "y", "yes"))
+_FALSY = frozenset(("false", "0", "f", "n", "no"))
+
+def _parse_bool(raw: str) -> bool:
+    """Parse a yes/no style answer; anything else raises ValueError."""
+    value = raw.lower()
+    if value in _TRUTHY:
+        return True
+    if value in _FALSY:
+        return False
+    raise ValueError(f"not a boolean: {raw!r}")
+
+# Setting value type -> parser for a new value typed at the prompt
+_SETTING_CONVERTERS: Dict[type, Callable[[str], Any]] = {
+    bool: _parse_bool,
+    int: int,
+    float: float,
+}
+
+def _convert_setting(current: Any, raw: str) -> Any:
+    """Parse raw as the type of the setting's current value; unparsable input is kept as text."""
+    convert = _SETTING_CONVERTERS.get(type(current))
+    if convert is None:
+        return raw
+    try:
+        return convert(raw)
+    except ValueError:
+        return raw
+
+def _print_page(rows: List[str], page: int, numbered: bool = False, page_size: int = _PAGE_SIZE) -> int:
+    """Print one page of preformatted rows and return the total number of pages."""
+    pages = max(1, -(-len(rows) // page_size))
+    for i in range(page * page_size, min(len(rows), (page + 1) * page_size)):
+        print(f"{i+1}. {rows[i]}" if numbered else f"  {rows[i]}")
+    if pages > 1:
+        print(f"-- Page {page + 1}/{pages} --")
+    return pages
+
+@lru_cache(maxsize=1024)
+def _iso_second(seconds: int) -> str:
+    """ISO-8601 UTC date and time (no fraction) of an epoch second."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+
+def _iso_ms(ms: int) -> str:
+    """Format epoch milliseconds as an ISO-8601 UTC timestamp ending in 'Z'.
+
+    Only the seconds part is formatted (and cached, since events generated together share
+    it); the milliseconds are appended to the cached prefix.
+    """
+    seconds, millis = divmod(ms, 1000)
+    return f"{_iso_second(seconds)}.{millis:03d}Z"
+
+# Wall-clock reading shared by every event of a batch (None outside of batches)
+_clock_snapshot: Optional[float] = None
+
+@contextmanager
+def _frozen_clock() -> Iterator[float]:
+    """Read the clock once and have _iso_now() use that reading until the block exits."""
+    global _clock_snapshot
+    previous = _clock_snapshot
+    _clock_snapshot = time.time()
+    try:
+        yield _clock_snapshot
+    finally:
+        _clock_snapshot = previous
+
+def _iso_now(seconds_ago: float = 0) -> str:
+    """Current UTC time, optionally shifted into the past, as an ISO-8601 'Z' timestamp."""
+    now = _clock_snapshot if _clock_snapshot is not None else time.time()
+    return _iso_ms(int((now - seconds_ago) * 1000))
+
+# Stdlib fallback encoders, built once: json.dumps() with non-default options makes a new
+# encoder on every call
+_INDENT_ENCODER = json.JSONEncoder(indent=2)
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+def _json_dumps(obj: Any, indent: bool = True) -> bytes:
+    """Serialize obj to JSON bytes, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return (_INDENT_ENCODER if indent else _COMPACT_ENCODER).encode(obj).encode()
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 class ConfigManager:
     """Handles loading, saving, and validating configuration for the simulator."""
+    __slots__ = ("config_file", "default_config", "config", "_dirty", "_autosave")
+
     def __init__(self, config_file: str = "config.json"):
         self.config_file = Path(config_file)
         self.default_config = self.load_default_config()
         self.config: Dict[str, Any] = self.load_config()
+        self._dirty = False
+        self._autosave = True
 
     def load_default_config(self) -> Dict[str, Any]:
-        if DEFAULT_CONFIG_PATH.exists():
-            with open(DEFAULT_CONFIG_PATH, "r") as f:
-                return json.load(f)
+        try:
+            st = DEFAULT_CONFIG_PATH.stat()
+        except OSError:
+            st = None
+        # An empty file is treated like a missing one instead of failing to parse
+        if st is not None and st.st_size:
+            return _read_json_file(DEFAULT_CONFIG_PATH)
         # fallback to hardcoded defaults
         return {
             "SIEM_Alert": {"default_severity": "Medium"},
@@ -50,28 +494,67 @@ class ConfigManager:
 
     def load_config(self) -> Dict[str, Any]:
         try:
-            if self.config_file.exists():
-                with self.config_file.open("r") as f:
-                    loaded_config = json.load(f)
-                # Merge loaded config with defaults
-                for k, v in self.default_config.items():
-                    if k not in loaded_config:
-                        loaded_config[k] = v
-                return loaded_config
-            else:
-                logging.warning(f"Config file '{self.config_file}' not found. Using default configuration.")
-                return self.default_config
+            # _read_json_file stats the file anyway, so a missing file is detected there
+            loaded_config = _read_json_file(self.config_file)
+        except FileNotFoundError:
+            logging.warning(f"Config file '{self.config_file}' not found. Using default configuration.")
+            return self.default_config
         except Exception as e:
             logging.error(f"Error loading config: {e}. Using default configuration.")
             return self.default_config
+        if not isinstance(loaded_config, dict):
+            logging.error(f"Error loading config: '{self.config_file}' does not hold a JSON object. Using default configuration.")
+            return self.default_config
+        # Merge loaded config with defaults
+        for k, v in self.default_config.items():
+            if k not in loaded_config:
+                loaded_config[k] = v
+        return loaded_config
 
     def save_config(self) -> None:
+        """Mark the config as changed and write it, unless writes are currently batched."""
+        self._dirty = True
+        if self._autosave:
+            self.flush()
+
+    def flush(self, durable: bool = False) -> None:
+        """Write the config to disk if it changed since the last write.
+
+        The file is written to a temporary sibling and moved into place, so a crash mid-write
+        never leaves a truncated config. Pass durable=True to also fsync before the move.
+        A save that leaves the serialized config identical to the file skips the write.
+        """
+        if not self._dirty:
+            return
+        tmp_file = self.config_file.with_suffix(self.config_file.suffix + ".tmp")
         try:
-            with self.config_file.open("w") as f:
-                json.dump(self.config, f, indent=2)
+            data = _json_dumps(self.config)
+            if not durable and _file_holds(self.config_file, data):
+                self._dirty = False
+                return
+            with tmp_file.open("wb") as f:
+                f.write(data)
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_file, self.config_file)
+            self._dirty = False
+            _remember_json_file(self.config_file, data)
         except Exception as e:
             logging.error(f"Error saving config: {e}")
 
+    @contextmanager
+    def batched(self) -> Iterator[None]:
+        """Coalesce all saves made inside the block into a single write on exit."""
+        previous = self._autosave
+        self._autosave = False
+        try:
+            yield
+        finally:
+            self._autosave = previous
+            if previous:
+                self.flush()
+
     def get(self, key: str, default: Optional[Any] = None) -> Any:
         return self.config.get(key, default)
 
@@ -79,10 +562,79 @@ class ConfigManager:
         self.config[key] = value
         self.save_config()
 
+# Static menu texts, joined once instead of printed line by line on every redraw
+_SOURCES_MENU = "\n".join((
+    "\n--- Manage Alert Sources ---",
+    "1. List Alert Sources",
+    "2. Add Alert Source",
+    "3. Remove Alert Source",
+    "4. Back to Main Menu",
+))
+_SETTINGS_MENU = "\n".join((
+    "a. Add Setting",
+    "e. Edit Setting",
+    "d. Delete Setting",
+    "b. Back to Alert Source Management",
+))
+_THRESHOLDS_MENU = "\n".join((
+    "s. Set Threshold",
+    "d. Delete Threshold",
+    "b. Back to Main Menu",
+))
+_ITEMS_MENU = "\n".join((
+    "1. Add Item",
+    "2. Edit Item",
+    "3. Remove Item",
+    "4. List Items",
+    "5. Search Items",
+    "6. Back to Alert Source Management",
+))
+
 class CRCSimulator:
-    def __init__(self, crc_api_base_url: Optional[str] = None, config_file: str = "config.json") -> None:
-        """Initialize the simulator with an optional API base URL and configuration file."""
+    def __init__(self, crc_api_base_url: Optional[str] = None, config_file: str = "config.json", seed: Optional[int] = None,
+                 providers: Optional[Dict[str, Callable[[bool], Dict[str, Any]]]] = None,
+                 sender: Optional[Callable[[str, Dict[str, Any]], Any]] = None) -> None:
+        """Initialize the simulator with an optional API base URL and configuration file.
+
+        A seed makes generated events reproducible: it seeds the shared Faker instances (the
+        one behind the Faker pools too) and the random module, which every generator draws from.
+        providers replaces the payload generators of the given event types (each takes the
+        manual flag), and sender replaces send_event for simulate_event and one-at-a-time
+        batches. Both are bound here: generators or send_event assigned on the instance
+        afterwards are not picked up.
+        """
         self.crc_api_base_url = crc_api_base_url
+        # Event type -> payload generator, bound once rather than looked up per event
+        self._providers: Dict[str, Callable[[bool], Dict[str, Any]]] = {
+            event_type: getattr(self, name) for event_type, name in _EVENT_GENERATORS.items()
+        }
+        if providers:
+            self._providers.update(providers)
+        self.custom_sender = sender  # None unless one was injected
+        self._send_event = sender or self.send_event
+        if seed is not None:
+            fake.seed_instance(seed)
+            _pool_fake.seed_instance(seed)
+            random.seed(seed)
+        self._fake: Any = fake
+        self._faker_pool = FakerPool(_pool_fake)
+        self._session: Optional[requests.Session] = None
+        self._sender: Optional[BackgroundSender] = None  # Set inside background_sending()
+        self._sink: Optional[BinaryIO] = None  # NDJSON file, set inside ndjson_sink()
+        self.verbose = True  # Print each event; batch runs turn this off unless asked otherwise
+        self._output_buffer: Optional[List[bytes]] = None
+        self._compact_output = False  # One-line JSON without dividers (set for large batch runs)
+        self._crc_templates: Dict[str, Dict[str, Any]] = {
+            event_type: {"eventId": None, "eventType": event_type, "eventTimestamp": None, "data": None}
+            for event_type in get_valid_event_types()
+        }
+        # Column views of alert source items (source -> (items list, length, {key: values})); rebuilt lazily after saves
+        self._columns: Dict[str, Tuple[List[Dict[str, Any]], int, Dict[str, List[Any]]]] = {}
+        # Sensor items by location per source (source -> (items list, length, {location: item})).
+        # Not cleared on save: only a changed items list or an item edit can invalidate it.
+        self._location_index: Dict[str, Tuple[List[Dict[str, Any]], int, Dict[str, Dict[str, Any]]]] = {}
+        # Compiled threshold checkers per alert source (source -> {field: checker})
+        self._validators: Dict[str, Dict[str, Callable[[str], bool]]] = {}
         self.config_manager = ConfigManager(config_file)
         self.config = self.config_manager.config
         # Refactored: all alert source data (fields, thresholds, settings, items) under self.alert_sources
@@ -102,7 +654,8 @@ class CRCSimulator:
                     "fields": default_fields.get(event_type, []),
                     "thresholds": {},
                     "settings": {},
-                    "items": []
+                    "items": [],
+                    "id_prefix": event_type[:3].upper()
                 }
             # Migrate old items if exist
             old_items = self.config.get("items", {})
@@ -123,18 +676,28 @@ class CRCSimulator:
     def save_config(self) -> None:
         """Save the current alert sources configuration to the config file."""
         self.config["alert_sources"] = self.alert_sources
+        self._invalidate_derived_caches()
         self.config_manager.save_config()
 
+    def _invalidate_derived_caches(self) -> None:
+        """Drop structures derived from alert source data so they are rebuilt on next use."""
+        self._columns.clear()
+        self._validators.clear()
+
     def list_alert_sources(self) -> List[str]:
         """Return a list of all alert source names."""
         return list(self.alert_sources.keys())
 
+    def alert_source_names(self) -> Tuple[str, ...]:
+        """Return the alert source names as an immutable snapshot for menus to index into."""
+        return tuple(self.alert_sources)
+
     def add_alert_source(self, name: str, fields: List[str]) -> None:
         """Add a new alert source with the given fields."""
         if name in self.alert_sources:
             logging.warning(f"Alert Source '{name}' already exists.")
             raise ValueError(f"Alert Source '{name}' already exists.")
-        self.alert_sources[name] = {"fields": fields, "thresholds": {}, "settings": {}, "items": []}
+        self.alert_sources[name] = {"fields": fields, "thresholds": {}, "settings": {}, "items": [], "next_id": 1, "id_prefix": name[:3].upper()}
         self.save_config()
         logging.info(f"Alert Source '{name}' added.")
 
@@ -150,30 +713,25 @@ class CRCSimulator:
     def manage_alert_sources(self) -> None:
         """Interactive menu to manage alert sources (add, remove, list)."""
         while True:
-            print("\n--- Manage Alert Sources ---")
-            print("1. List Alert Sources")
-            print("2. Add Alert Source")
-            print("3. Remove Alert Source")
-            print("4. Back to Main Menu")
-            choice = input("Enter your choice: ").strip()
+            print(_SOURCES_MENU)
+            choice = _prompt("Enter your choice: ").strip()
             if choice == '1':
-                sources = self.list_alert_sources()
+                sources = self.alert_source_names()
                 if not sources:
                     print("No alert sources defined.")
                 else:
                     print("\nAlert Sources:")
-                    for i, src in enumerate(sources):
-                        print(f"{i+1}. {src}")
+                    print(_numbered_menu(sources))
             elif choice == '2':
-                name = input("Enter new alert source name: ").strip()
+                name = _prompt("Enter new alert source name: ").strip()
                 if not name:
                     print("Name cannot be empty.")
                     continue
                 if name in self.alert_sources:
                     print("Alert source already exists.")
                     continue
-                fields = input("Enter field names (comma separated): ").strip()
-                field_list = [f.strip() for f in fields.split(',') if f.strip()]
+                fields = _prompt("Enter field names (comma separated): ").strip()
+                field_list = _parse_fields(fields)
                 if not field_list:
                     print("At least one field is required.")
                     continue
@@ -183,7 +741,7 @@ class CRCSimulator:
                 except Exception as e:
                     print(f"Error: {e}")
             elif choice == '3':
-                name = input("Enter alert source name to remove: ").strip()
+                name = _prompt("Enter alert source name to remove: ").strip()
                 if name not in self.alert_sources:
                     print("Alert source not found.")
                     continue
@@ -199,62 +757,47 @@ class CRCSimulator:
 
     def manage_settings_for_alert_source(self) -> None:
         """Interactive menu to manage settings for a selected alert source."""
-        sources = self.list_alert_sources()
+        sources = self.alert_source_names()
         if not sources:
             print("No alert sources available. Please add an alert source first.")
             return
-        for i, src in enumerate(sources):
-            print(f"{i+1}. {src}")
-        choice = input("Select alert source (number or name, or 'back'): ").strip()
-        if choice.lower() == 'back':
+        print(_numbered_menu(sources))
+        selected = _select_name(sources, "Select alert source (number or name, or 'back'): ", "alert source name")
+        if selected is None:
             return
-        try:
-            idx = int(choice) - 1
-            if 0 <= idx < len(sources):
-                selected = sources[idx]
-            else:
-                print("Invalid number.")
-                return
-        except ValueError:
-            if choice in sources:
-                selected = choice
-            else:
-                print("Invalid alert source name.")
-                return
+        with self.config_manager.batched():
+            self._settings_menu(selected)
+
+    def _settings_menu(self, selected: str) -> None:
+        """Settings loop for one alert source; saves are flushed by the caller."""
         settings = self.alert_sources[selected]["settings"]
+        header = f"\n--- Settings for '{selected}' ---"
         while True:
-            print(f"\n--- Settings for '{selected}' ---")
-            if settings:
-                for i, (k, v) in enumerate(settings.items()):
-                    print(f"{i+1}. {k}: {v}")
-            else:
-                print("No settings defined.")
-            print("a. Add Setting")
-            print("e. Edit Setting")
-            print("d. Delete Setting")
-            print("b. Back to Alert Source Management")
-            action = input("Choose action: ").strip().lower()
+            # Settings change inside the loop, so only the header and menu are fixed
+            listing = "\n".join(f"{i}. {k}: {v}" for i, (k, v) in enumerate(settings.items(), 1))
+            print(header, listing or "No settings defined.", _SETTINGS_MENU, sep="\n")
+            action = _prompt("Choose action: ").strip().lower()
             if action == 'a':
-                key = input("Enter setting name: ").strip()
+                key = _prompt("Enter setting name: ").strip()
                 if not key:
                     print("Setting name cannot be empty.")
                     continue
-                value = input("Enter setting value: ").strip()
+                value = _prompt("Enter setting value: ").strip()
                 settings[key] = value
                 self.save_config()
                 print("Setting added.")
             elif action == 'e':
-                key = input("Enter setting name to edit: ").strip()
-                if key not in settings:
+                key = _match_setting(settings, _prompt("Enter setting name to edit: ").strip())
+                if key is None:
                     print("Setting not found.")
                     continue
-                value = input(f"Enter new value for '{key}': ").strip()
-                settings[key] = value
+                value = _prompt(f"Enter new value for '{key}': ").strip()
+                settings[key] = _convert_setting(settings[key], value)
                 self.save_config()
                 print("Setting updated.")
             elif action == 'd':
-                key = input("Enter setting name to delete: ").strip()
-                if key in settings:
+                key = _match_setting(settings, _prompt("Enter setting name to delete: ").strip())
+                if key is not None:
                     del settings[key]
                     self.save_config()
                     print("Setting deleted.")
@@ -265,39 +808,98 @@ class CRCSimulator:
             else:
                 print("Invalid action.")
 
+    def manage_thresholds_for_alert_source(self) -> None:
+        """Interactive menu to manage field thresholds for a selected alert source."""
+        sources = self.alert_source_names()
+        if not sources:
+            print("No alert sources available. Please add an alert source first.")
+            return
+        print(_numbered_menu(sources))
+        selected = _select_name(sources, "Select alert source (number or name, or 'back'): ", "alert source name")
+        if selected is None:
+            return
+        with self.config_manager.batched():
+            self._thresholds_menu(selected)
+
+    def _thresholds_menu(self, selected: str) -> None:
+        """Threshold loop for one alert source; saves are flushed by the caller."""
+        header = f"\n--- Thresholds for '{selected}' ---"
+        while True:
+            thresholds = self.alert_sources[selected]["thresholds"]
+            listing = "\n".join(f"{i}. {field}: {_format_threshold(threshold)}"
+                                for i, (field, threshold) in enumerate(thresholds.items(), 1))
+            print(header, listing or "No thresholds defined.", _THRESHOLDS_MENU, sep="\n")
+            action = _prompt("Choose action: ").strip().lower()
+            if action == 's':
+                fields = self.alert_sources[selected]["fields"]
+                field = _prompt(f"Enter field name ({', '.join(fields)}): ").strip()
+                if field not in fields:
+                    print("Unknown field.")
+                    continue
+                threshold = self._prompt_threshold()
+                if threshold is not None:
+                    self.set_threshold(selected, field, threshold)
+                    print("Threshold set.")
+            elif action == 'd':
+                field = _prompt("Enter field name to remove the threshold from: ").strip()
+                try:
+                    self.remove_threshold(selected, field)
+                    print("Threshold removed.")
+                except ValueError:
+                    print("Threshold not found.")
+            elif action == 'b':
+                break
+            else:
+                print("Invalid action.")
+
+    def _prompt_threshold(self) -> Any:
+        """Ask for a range, list or exact-value threshold; None (after a message) on bad input."""
+        kind = _prompt("Threshold type - (r)ange, (l)ist of allowed values, (e)xact value: ").strip().lower()
+        if kind == 'r':
+            try:
+                low = _parse_bound(_prompt("Enter minimum: ").strip())
+                high = _parse_bound(_prompt("Enter maximum: ").strip())
+            except ValueError:
+                print("Minimum and maximum must be numbers.")
+                return None
+            if low > high:
+                print("Minimum cannot be greater than maximum.")
+                return None
+            return {"min": low, "max": high}
+        if kind == 'l':
+            values = _parse_fields(_prompt("Enter allowed values (comma separated): "))
+            if not values:
+                print("At least one value is required.")
+                return None
+            return values
+        if kind == 'e':
+            value = _prompt("Enter exact value: ").strip()
+            if not value:
+                print("Value cannot be empty.")
+                return None
+            return value
+        print("Invalid threshold type.")
+        return None
+
     def manage_items_for_module(self) -> None:
         """Interactive menu to manage items for a selected alert source."""
-        sources = self.list_alert_sources()
+        sources = self.alert_source_names()
         if not sources:
             print("No alert sources available. Please add an alert source first.")
             return
-        for i, src in enumerate(sources):
-            print(f"{i+1}. {src}")
-        choice = input("Select alert source (number or name, or 'back'): ").strip()
-        if choice.lower() == 'back':
+        print(_numbered_menu(sources))
+        selected = _select_name(sources, "Select alert source (number or name, or 'back'): ", "alert source name")
+        if selected is None:
             return
-        try:
-            idx = int(choice) - 1
-            if 0 <= idx < len(sources):
-                selected = sources[idx]
-            else:
-                print("Invalid number.")
-                return
-        except ValueError:
-            if choice in sources:
-                selected = choice
-            else:
-                print("Invalid alert source name.")
-                return
+        with self.config_manager.batched():
+            self._items_menu(selected)
+
+    def _items_menu(self, selected: str) -> None:
+        """Item management loop for one alert source; saves are flushed by the caller."""
+        menu = f"\n--- Manage Items for '{selected}' ---\n{_ITEMS_MENU}"
         while True:
-            print(f"\n--- Manage Items for '{selected}' ---")
-            print("1. Add Item")
-            print("2. Edit Item")
-            print("3. Remove Item")
-            print("4. List Items")
-            print("5. Search Items")
-            print("6. Back to Alert Source Management")
-            action = input("Enter your choice: ").strip()
+            print(menu)
+            action = _prompt("Enter your choice: ").strip()
             if action == '1':
                 self.add_item_to_source(selected)
             elif action == '2':
@@ -318,52 +920,62 @@ class CRCSimulator:
         fields = self.alert_sources[source]["fields"]
         item_details = {}
         for field in fields:
-            value = input(f"Enter {field.replace('_', ' ').title()}: ").strip()
+            value = _prompt(f"Enter {field.replace('_', ' ').title()}: ").strip()
             try:
                 self.validate_field_value(source, field, value)
             except Exception as e:
                 print(f"Error: {e}")
                 return
             item_details[field] = value
-        item_id_prefix = source[:3].upper()
-        existing_ids = [int(item["id"].split("-")[1]) for item in self.alert_sources[source]["items"] if item["id"].startswith(item_id_prefix)]
-        new_item_id = f"{item_id_prefix}-{max(existing_ids) + 1:03d}" if existing_ids else f"{item_id_prefix}-001"
+        new_item_id = self._next_item_id(source)
         new_item = {"id": new_item_id, **item_details}
         self.alert_sources[source]["items"].append(new_item)
         self.save_config()
         print(f"Item added: {new_item}")
 
+    def _next_item_id(self, source: str, prefix: Optional[str] = None) -> str:
+        """Allocate the next item ID for a source from its persisted ``next_id`` counter.
+
+        The prefix defaults to the source's cached ``id_prefix``.
+        """
+        source_data = self.alert_sources[source]
+        if prefix is None:
+            prefix = source_data.get("id_prefix")
+            if prefix is None:
+                prefix = source_data["id_prefix"] = source[:3].upper()
+        next_id = source_data.get("next_id")
+        if next_id is None:
+            # Configs written before the counter existed: derive it once from the current items
+            numbers = self._item_column(source, "_id_number", _item_number)
+            next_id = max(filter(None, numbers), default=0) + 1
+        source_data["next_id"] = next_id + 1
+        return f"{prefix}-{next_id:03d}"
+
     def edit_item_in_source(self, source: str) -> None:
         """Edit an existing item in the given alert source."""
         items = self.alert_sources[source]["items"]
         if not items:
             print("No items to edit.")
             return
-        for i, item in enumerate(items):
-            print(f"{i+1}. ID: {item['id']}, " + ", ".join(f"{k}: {v}" for k, v in item.items() if k != "id"))
-        idx = input("Select item to edit (number or 'back'): ").strip()
-        if idx.lower() == 'back':
-            return
-        try:
-            idx = int(idx) - 1
-            if 0 <= idx < len(items):
-                item = items[idx]
-            else:
-                print("Invalid number.")
-                return
-        except ValueError:
-            print("Invalid input.")
+        idx = self._select_item_index(source, "edit")
+        if idx is None:
             return
+        item = items[idx]
+        # Every new value is validated before any is applied, so a rejected one leaves the item as it was
+        changes = {}
         for field in self.alert_sources[source]["fields"]:
             old_val = item.get(field, "")
-            value = input(f"Enter new value for {field} (leave empty to keep '{old_val}'): ").strip()
+            value = _prompt(f"Enter new value for {field} (leave empty to keep '{old_val}'): ").strip()
             if value:
                 try:
                     self.validate_field_value(source, field, value)
                 except Exception as e:
                     print(f"Error: {e}")
                     return
-                item[field] = value
+                changes[field] = value
+        item.update(changes)
+        self._columns.pop(source, None)
+        self._location_index.pop(source, None)
         self.save_config()
         print("Item updated.")
 
@@ -373,31 +985,56 @@ class CRCSimulator:
         if not items:
             print("No items to remove.")
             return
-        for i, item in enumerate(items):
-            print(f"{i+1}. ID: {item['id']}, " + ", ".join(f"{k}: {v}" for k, v in item.items() if k != "id"))
-        idx = input("Select item to remove (number or 'back'): ").strip()
-        if idx.lower() == 'back':
+        idx = self._select_item_index(source, "remove")
+        if idx is None:
             return
-        try:
-            idx = int(idx) - 1
-            if 0 <= idx < len(items):
-                removed = items.pop(idx)
-                self.save_config()
-                print(f"Item removed: {removed}")
-            else:
-                print("Invalid number.")
-        except ValueError:
-            print("Invalid input.")
+        removed = items.pop(idx)
+        self.save_config()
+        print(f"Item removed: {removed}")
+
+    def _select_item_index(self, source: str, action: str) -> Optional[int]:
+        """Page through a source's items and return the index the user selects, or None."""
+        rows = self._item_column(source, "_summary", _format_item_summary)
+        page = 0
+        while True:
+            pages = _print_page(rows, page, numbered=True)
+            paging_hint = ", 'n'/'p' for next/previous page" if pages > 1 else ""
+            choice = _prompt(f"Select item to {action} (number or 'back'{paging_hint}): ").strip().lower()
+            if choice == 'back':
+                return None
+            if pages > 1 and choice in ('n', 'p'):
+                page = min(page + 1, pages - 1) if choice == 'n' else max(page - 1, 0)
+                continue
+            try:
+                idx = int(choice) - 1
+            except ValueError:
+                print("Invalid input.")
+                return None
+            if 0 <= idx < len(rows):
+                return idx
+            print("Invalid number.")
+            return None
 
     def list_items_by_module(self, source: str) -> None:
-        """List all items for the given alert source."""
+        """List all items for the given alert source, one page at a time."""
         items = self.alert_sources[source]["items"]
         if not items:
             print(f"No items found for alert source '{source}'.")
             return
         print(f"\n--- Items for '{source}' ---")
-        for item in items:
-            print(f"  ID: {item['id']}, " + ", ".join(f"{k.replace('_', ' ').title()}: {v}" for k, v in item.items() if k != "id"))
+        rows = self._item_column(source, "_details", _format_item_details)
+        page = 0
+        while True:
+            pages = _print_page(rows, page)
+            if pages <= 1:
+                return
+            choice = _prompt("'n' for next page, 'p' for previous page, Enter to go back: ").strip().lower()
+            if choice == 'n':
+                page = min(page + 1, pages - 1)
+            elif choice == 'p':
+                page = max(page - 1, 0)
+            else:
+                return
 
     def search_items_in_source(self, source: str) -> None:
         """Search for items by ID or name in a given alert source."""
@@ -405,98 +1042,400 @@ class CRCSimulator:
         if not items:
             print(f"No items found for alert source '{source}'.")
             return
-        query = input("Enter search term (ID or part of name): ").strip().lower()
-        results = [item for item in items if query in item.get("id", "").lower() or query in str(item).lower()]
+        query = _prompt("Enter search term (ID or part of name): ").strip().lower()
+        search_text = self._item_column(source, "_search", lambda item: " ".join(map(str, item.values())).lower())
+        rows = self._item_column(source, "_details", _format_item_details)
+        results = [row for row, text in zip(rows, search_text) if query in text]
         if not results:
             print("No matching items found.")
         else:
             print(f"Found {len(results)} matching items:")
-            for item in results:
-                print(f"  ID: {item['id']}, " + ", ".join(f"{k.replace('_', ' ').title()}: {v}" for k, v in item.items() if k != "id"))
+            for row in results:
+                print(f"  {row}")
+
+    def _item_column(self, source: str, key: str, derive: Optional[Callable[[Dict[str, Any]], Any]] = None) -> List[Any]:
+        """Return one value per item of the source (a column view parallel to its items list).
+
+        The value is ``item.get(key)``, or ``derive(item)`` for computed columns. Columns are
+        cached until the next save, or until the items list is replaced or changes length.
+        """
+        items = self.alert_sources[source]["items"]
+        cached = self._columns.get(source)
+        if cached is None or cached[0] is not items or cached[1] != len(items):
+            cached = self._columns[source] = (items, len(items), {})
+        columns = cached[2]
+        column = columns.get(key)
+        if column is None:
+            column = columns[key] = [derive(item) for item in items] if derive else [item.get(key) for item in items]
+        return column
 
     def validate_field_value(self, alert_source: str, field: str, value: str) -> bool:
-        """Validate a value for a field according to its threshold (if exists) or basic rules."""
+        """Validate a value for a field according to its threshold (if exists) or basic rules.
+
+        Thresholds are compiled into per-field checkers on first use. set_threshold(),
+        remove_threshold() and save_config() drop the compiled checkers, so changes made
+        through them apply at once; direct edits to a source's thresholds apply after the
+        next save_config().
+        """
+        checkers = self._validators.get(alert_source)
+        if checkers is None:
+            checkers = self._validators[alert_source] = self._compile_validator(alert_source)
+        check = checkers.get(field)
+        if check is not None:
+            return check(value)
+        if not value:
+            _fail_validation(f"{field} cannot be empty.")
+        return True
+
+    def set_threshold(self, alert_source: str, field: str, threshold: Any) -> None:
+        """Set a field's threshold (a {"min", "max"} range, a list of allowed values, or an exact value)."""
+        if alert_source not in self.alert_sources:
+            raise ValueError(f"Alert Source '{alert_source}' not found.")
+        self.alert_sources[alert_source]["thresholds"][field] = threshold
+        self._validators.pop(alert_source, None)
+        self.save_config()
+
+    def remove_threshold(self, alert_source: str, field: str) -> None:
+        """Remove a field's threshold."""
+        thresholds = self.alert_sources.get(alert_source, {}).get("thresholds", {})
+        if field not in thresholds:
+            raise ValueError(f"No threshold for '{field}' in '{alert_source}'.")
+        del thresholds[field]
+        self._validators.pop(alert_source, None)
+        self.save_config()
+
+    def _compile_validator(self, alert_source: str) -> Dict[str, Callable[[str], bool]]:
+        """Generate one checker function per thresholded field of an alert source.
+
+        Each threshold becomes straight-line code with its bounds and error messages bound
+        as constants, so a check does no type dispatch or message formatting.
+        """
+        namespace: Dict[str, Any] = {"_fail": _fail_validation, "_parse_number": _parse_number}
+        lines: List[str] = []
         thresholds = self.alert_sources[alert_source]["thresholds"]
-        if field in thresholds:
-            threshold = thresholds[field]
+        for i, (field, threshold) in enumerate(thresholds.items()):
+            lines.append(f"def check_{i}(value):")
             # Range threshold
             if isinstance(threshold, dict) and "min" in threshold and "max" in threshold:
-                try:
-                    num_val = float(value)
-                except ValueError:
-                    logging.error(f"{field} must be a number.")
-                    raise ValueError(f"{field} must be a number.")
-                if not (threshold["min"] <= num_val <= threshold["max"]):
-                    logging.error(f"{field} must be between {threshold['min']} and {threshold['max']}.")
-                    raise ValueError(f"{field} must be between {threshold['min']} and {threshold['max']}.")
+                namespace[f"lo_{i}"] = threshold["min"]
+                namespace[f"hi_{i}"] = threshold["max"]
+                namespace[f"not_number_{i}"] = f"{field} must be a number."
+                namespace[f"out_of_range_{i}"] = f"{field} must be between {threshold['min']} and {threshold['max']}."
+                lines += ["    num_val = _parse_number(value)",
+                          "    if num_val is None:",
+                          f"        _fail(not_number_{i})",
+                          f"    if not (lo_{i} <= num_val <= hi_{i}):",
+                          f"        _fail(out_of_range_{i})"]
             # List threshold
             elif isinstance(threshold, list):
-                if value not in threshold:
-                    logging.error(f"{field} must be one of: {', '.join(threshold)}.")
-                    raise ValueError(f"{field} must be one of: {', '.join(threshold)}.")
+                try:
+                    # Set membership instead of a list scan; equality semantics are the same
+                    namespace[f"allowed_{i}"] = frozenset(threshold)
+                except TypeError:  # Unhashable entries (nested JSON) keep the list
+                    namespace[f"allowed_{i}"] = threshold
+                namespace[f"not_allowed_{i}"] = f"{field} must be one of: {', '.join(map(str, threshold))}."
+                lines += [f"    if value not in allowed_{i}:",
+                          f"        _fail(not_allowed_{i})"]
             # Single value threshold
             else:
-                if str(value) != str(threshold):
-                    logging.error(f"{field} must be exactly: {threshold}.")
-                    raise ValueError(f"{field} must be exactly: {threshold}.")
-        else:
-            if not value:
-                logging.error(f"{field} cannot be empty.")
-                raise ValueError(f"{field} cannot be empty.")
-        return True
+                namespace[f"expected_{i}"] = str(threshold)
+                namespace[f"mismatch_{i}"] = f"{field} must be exactly: {threshold}."
+                lines += [f"    if str(value) != expected_{i}:",
+                          f"        _fail(mismatch_{i})"]
+            lines.append("    return True")
+        exec("\n".join(lines), namespace)
+        return {field: namespace[f"check_{i}"] for i, field in enumerate(thresholds)}
 
-    def simulate_event(self, event_type: str, manual: bool = False) -> None:
-        """Simulate an event of the given type, with optional manual input."""
-        event_data = None
-        if event_type == "SIEM_Alert":
-            event_data = self._get_siem_alert_details(manual)
-        elif event_type == "Login_Alert":
-            event_data = self._get_login_alert_details(manual)
-        elif event_type == "Smart_Fence_Alert":
-            event_data = self._get_smart_fence_alert_details(manual)
-        elif event_type == "Location_Based_Alert":
-            event_data = self._get_location_based_alert_details(manual)
-        elif event_type == "Motion_Sensor_Alert":
-            event_data = self.get_motion_sensor_alert_details(manual)
-        elif event_type == "IR_Sensor_Alert":
-            event_data = self._get_ir_sensor_alert_details(manual)
-        else:
-            logging.error(f"Unknown event type '{event_type}'")
-            print(f"Error: Unknown event type '{event_type}'")
-            return
+    def simulate_event(self, event_type: str, manual: bool = False, review_items: bool = True) -> None:
+        """Simulate an event of the given type, with optional manual input.
+
+        Without review_items, auto-generated items are left marked for a later
+        review_auto_generated_items() instead of being offered for keeping right away.
+        """
+        event_data = self._generate_event_data(event_type, manual)
         if event_data:
-            self.send_event(event_type, event_data)
+            self._send_event(event_type, event_data)
+            if review_items:
+                self.review_auto_generated_items([event_type])
+
+    def review_auto_generated_items(self, event_types: Iterable[str]) -> None:
+        """Ask whether to keep the items auto-generated for the given event types, then drop the rest."""
+        for event_type in event_types:
+            self._review_auto_generated_items(event_type)
+        self.cleanup_simulation_items()
+
+    def simulate_events_batch(self, event_type: str, n: int, concurrency: int = 1, verbose: bool = False,
+                              bulk: bool = False, compact: bool = False, review_items: bool = False) -> List[Dict[str, Any]]:
+        """Generate and send n automatic events of one type, returning them in CRC format.
+
+        Faker values are drawn from pre-generated pools instead of calling the providers
+        per event. Items auto-generated along the way are discarded without prompting, or,
+        with review_items, offered for keeping once the whole batch has been printed.
+        With an API URL set, bulk sends the events in a few requests to the bulk endpoint
+        (see send_bulk); otherwise, with concurrency > 1, up to that many POSTs run in
+        parallel while the next events are generated. Events are only printed when verbose
+        is set, and then in buffered chunks rather than line by line; compact prints each
+        as a single JSON line without the divider lines.
+
+        An injected sender receives every event, as in simulate_event, and the list holds
+        what it returned. Bulk and concurrent sends POST events themselves, so they are
+        refused rather than bypassing it.
+        """
+        if event_type not in get_valid_event_types():
+            raise ValueError(f"Unknown event type '{event_type}'")
+        if self.custom_sender is not None and self.crc_api_base_url and (bulk or concurrency > 1):
+            raise ValueError("Bulk and concurrent sends cannot go through an injected sender")
+        # Generated timestamps are offsets from one clock reading taken for the whole batch
+        with self.buffered_output(verbose, compact), self.pooled_faker(), _frozen_clock():
+            if bulk and self.crc_api_base_url:
+                generate = self._providers[event_type]
+                events = []
+                sent = 0
+                for _ in range(n):
+                    full_event = self._convert_to_crc_format(event_type, generate(False))
+                    self._emit_event(event_type, full_event)
+                    events.append(full_event)
+                    # Send each full chunk as soon as it is complete rather than all at the end
+                    if len(events) - sent == _BULK_CHUNK:
+                        self.send_bulk(events[sent:])
+                        sent = len(events)
+                if sent < len(events):
+                    self.send_bulk(events[sent:])
+            elif concurrency > 1 and self.crc_api_base_url:
+                events = self._send_events_concurrently(event_type, n, concurrency)
+            else:
+                generate = self._providers[event_type]  # Resolved once for the whole batch
+                events = [self._send_event(event_type, generate(False)) for _ in range(n)]
+        if review_items:
+            self.review_auto_generated_items([event_type])
+        elif event_type in self.alert_sources:
+            for item in self.alert_sources[event_type]["items"]:
+                if item.pop("auto_generated", None):
+                    item["_remove_after_simulation"] = True
             self.cleanup_simulation_items()
+        return events
+
+    def _send_events_concurrently(self, event_type: str, n: int, concurrency: int) -> List[Dict[str, Any]]:
+        """Generate n events on this thread and POST them from a pool of worker threads."""
+        events = []
+        generate = self._providers[event_type]
+        # Bound the number of queued POSTs so generation cannot run arbitrarily far ahead
+        in_flight = threading.BoundedSemaphore(concurrency * 2)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for _ in range(n):
+                full_event = self._convert_to_crc_format(event_type, generate(False))
+                body = self._emit_event(event_type, full_event)
+                in_flight.acquire()
+                executor.submit(self._post_event, full_event, body).add_done_callback(lambda _: in_flight.release())
+                events.append(full_event)
+        return events
+
+    def _generate_event_data(self, event_type: str, manual: bool = False) -> Optional[Dict[str, Any]]:
+        """Build the payload for one event of the given type; returns None for unknown types."""
+        generate = self._providers.get(event_type)
+        if generate is None:
+            logging.error(f"Unknown event type '{event_type}'")
+            print(f"Error: Unknown event type '{event_type}'")
+            return None
+        return generate(manual)
 
-    def send_event(self, event_type: str, event_data: Dict[str, Any]) -> None:
-        """Format and 'send' (print) an event, and handle auto-generated items."""
+    def send_event(self, event_type: str, event_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Format and 'send' (print) an event, returning it in CRC format."""
         full_event = self._convert_to_crc_format(event_type, event_data)
-        print("-" * 20 + f" Event Generated ({event_type}) " + "-" * 20)
-        print(json.dumps(full_event, indent=2))
-        print("-" * (42 + len(event_type)))
+        body = self._emit_event(event_type, full_event)
         # If a CRC API base URL is set, attempt to send the event to the API.
         if self.crc_api_base_url:
-            url = f"{self.crc_api_base_url}/events" # Assuming an '/events' endpoint
-            headers = {"Content-Type": "application/json"}
+            if self._sender is not None:
+                self._sender.submit(full_event)
+            else:
+                self._post_event(full_event, body)
+        elif self.verbose:
+            logging.warning("--> API URL not set. Event printed to console only.")
+        return full_event
+
+    @contextmanager
+    def pooled_faker(self) -> Iterator[None]:
+        """Have the generators draw Faker values from the simulator's pools inside the block."""
+        previous = self._fake
+        self._fake = self._faker_pool
+        try:
+            yield
+        finally:
+            self._fake = previous
+
+    @contextmanager
+    def background_sending(self) -> Iterator[None]:
+        """Have send_event queue its POSTs for a worker thread while inside the block.
+
+        Events are still posted in the order they were sent; leaving the block waits until
+        all of them have gone out.
+        """
+        if self._sender is not None or not self.crc_api_base_url:
+            yield
+            return
+        self._sender = BackgroundSender(self._post_event)
+        try:
+            yield
+        finally:
+            sender, self._sender = self._sender, None
+            sender.close()
+
+    @contextmanager
+    def ndjson_sink(self, path: str) -> Iterator[None]:
+        """Append every event sent inside the block to a newline-delimited JSON file.
+
+        Lines go through a 1 MiB write buffer, so the file sees a few large writes rather
+        than one per event; it is flushed and closed when the block exits.
+        """
+        previous = self._sink
+        with open(path, "ab", buffering=1 << 20) as sink:
+            self._sink = sink
             try:
-                # Note: Sending is disabled by default, enable if needed
-                # response = requests.post(url, headers=headers, json=full_event, timeout=10)
-                # response.raise_for_status() # Raise an exception for bad status codes (4xx or 5xx)
-                # print(f"--> Event successfully sent to CRC API: {url} (Status Code: {response.status_code})")
-                logging.info(f"--> NOTE: Sending to API ({url}) is currently disabled in the code.")
-                pass # Comment out pass and uncomment requests.post above to enable sending
-            except requests.exceptions.RequestException as e:#
-                logging.error(f"Error sending event to CRC API ({url}): {e}")
-            except Exception as e:
-                 logging.error(f"An unexpected error occurred during sending to {url}: {e}")
+                yield
+            finally:
+                self._sink = previous
+
+    @contextmanager
+    def buffered_output(self, verbose: bool = True, compact: bool = False) -> Iterator[None]:
+        """Collect printed events in memory and write them to stdout in chunks, not per event.
+
+        compact prints each event as a single JSON line without the divider lines.
+        """
+        previous_verbose = self.verbose
+        self.verbose = verbose
+        self._compact_output = compact
+        self._output_buffer = []
+        try:
+            yield
+        finally:
+            self._flush_output()
+            self._output_buffer = None
+            self._compact_output = False
+            self.verbose = previous_verbose
+
+    def _emit_event(self, event_type: str, full_event: Dict[str, Any]) -> Optional[bytes]:
+        """Print the event and write it to the NDJSON sink, if one is open.
+
+        Returns the compact JSON encoding when one was made, for _post_event to reuse.
+        """
+        body = self._print_event(event_type, full_event)
+        if self._sink is not None:
+            if body is None:
+                body = _json_dumps(full_event, indent=False)
+            self._sink.write(body + b"\n")
+        return body
+
+    def _print_event(self, event_type: str, full_event: Dict[str, Any]) -> Optional[bytes]:
+        """Print a formatted event between divider lines (buffered during batch runs).
+
+        Compact batch runs print one unindented JSON line per event instead; that encoding is
+        also what gets POSTed, so it is returned for _post_event to reuse.
+        """
+        if not self.verbose:
+            return None
+        if self._output_buffer is None:
+            # The whole block in one write rather than three print() calls
+            sys.stdout.write(_format_event_block(event_type, full_event).decode())
+            return None
+        body = None
+        if self._compact_output:
+            body = _json_dumps(full_event, indent=False)
+            self._output_buffer.append(body + b"\n")
         else:
-            logging.warning("--> API URL not set. Event printed to console only.")
-        # Ask user if they want to save auto-generated item as permanent
+            self._output_buffer.append(_format_event_block(event_type, full_event))
+        if len(self._output_buffer) >= _OUTPUT_FLUSH_EVERY:
+            self._flush_output()
+        return body
+
+    def _flush_output(self) -> None:
+        """Write any buffered event output to stdout in one call."""
+        if self._output_buffer:
+            _write_stdout(b"".join(self._output_buffer))
+            self._output_buffer.clear()
+
+    def _post_event(self, full_event: Dict[str, Any], body: Optional[bytes] = None) -> None:
+        """POST one event to the CRC API, logging (not raising) any failure.
+
+        body is the event's compact JSON encoding when the caller already has it.
+        """
+        url = f"{self.crc_api_base_url}/events" # Assuming an '/events' endpoint
+        try:
+            if body is None:
+                body = _json_dumps(full_event, indent=False)
+            response = self._http_session().post(url, data=body, timeout=10)
+            response.raise_for_status() # Raise an exception for bad status codes (4xx or 5xx)
+            if self.verbose:
+                print(f"--> Event successfully sent to CRC API: {url} (Status Code: {response.status_code})")
+        except requests.exceptions.RequestException as e:
+            logging.error(f"Error sending event to CRC API ({url}): {e}")
+        except Exception as e:
+            logging.error(f"An unexpected error occurred during sending to {url}: {e}")
+
+    def send_bulk(self, events: List[Dict[str, Any]]) -> None:
+        """POST already formatted events to the CRC API's bulk endpoint.
+
+        Events go out as ``{"events": [...]}`` bodies of up to _BULK_CHUNK events, each
+        encoded in one call. Failures are logged, not raised.
+        """
+        url = f"{self.crc_api_base_url}/events/bulk"
+        session = self._http_session()
+        for start in range(0, len(events), _BULK_CHUNK):
+            chunk = events[start:start + _BULK_CHUNK]
+            try:
+                response = session.post(url, data=_json_dumps({"events": chunk}, indent=False), timeout=30)
+                response.raise_for_status()
+                if self.verbose:
+                    print(f"--> {len(chunk)} events successfully sent to CRC API: {url} (Status Code: {response.status_code})")
+            except requests.exceptions.RequestException as e:
+                logging.error(f"Error sending {len(chunk)} events to CRC API ({url}): {e}")
+            except Exception as e:
+                logging.error(f"An unexpected error occurred during sending to {url}: {e}")
+
+    def _items_by_location(self, source: str) -> Dict[str, Dict[str, Any]]:
+        """Map each location to its sensor item for a source, rebuilding only when the items list changed."""
+        items = self.alert_sources[source]["items"]
+        cached = self._location_index.get(source)
+        if cached is None or cached[0] is not items or cached[1] != len(items):
+            index = {item["location"]: item for item in reversed(items) if "location" in item}
+            cached = self._location_index[source] = (items, len(items), index)
+        return cached[2]
+
+    def _add_sensor_item(self, source: str, item: Dict[str, Any]) -> None:
+        """Append an auto-generated sensor item and keep the location index in step."""
+        items = self.alert_sources[source]["items"]
+        index = self._items_by_location(source)
+        items.append(item)
+        index[item["location"]] = item
+        self._location_index[source] = (items, len(items), index)
+
+    def _http_session(self) -> requests.Session:
+        """Return the pooled HTTP session used for API sends, creating it on first use.
+
+        Reusing one session keeps connections alive between events instead of paying a
+        TCP (and TLS) handshake per POST.
+        """
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_maxsize=32, max_retries=Retry(total=3, backoff_factor=0.1))
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update({"Content-Type": "application/json"})
+            self._session = session
+        return self._session
+
+    def close(self) -> None:
+        """Close the pooled HTTP session's connections; a later send opens a new session."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _review_auto_generated_items(self, event_type: str) -> None:
+        """Ask the user whether to keep each item auto-generated for the event."""
         if event_type in self.alert_sources:
             for item in self.alert_sources[event_type]["items"]:
                 if item.get("auto_generated"):
                     print(f"\nA temporary item was auto-generated for '{event_type}': {item}")
-                    save = input("Do you want to save this item as permanent? (y/n): ").strip().lower()
+                    save = _prompt("Do you want to save this item as permanent? (y/n): ").strip().lower()
                     if save == 'y':
                         item.pop("auto_generated", None)
                         print("Item saved as permanent.")
@@ -506,41 +1445,57 @@ class CRCSimulator:
             self.save_config()
 
     def cleanup_simulation_items(self) -> None:
-        """Remove all items marked for deletion after simulation."""
+        """Remove all items marked for deletion after simulation.
+
+        IDs at the top of a source's counter that belonged to removed items are handed
+        back, so discarded auto-generated items do not use up IDs permanently.
+        """
+        removed = False
         for module_data in self.alert_sources.values():
-            module_data["items"] = [item for item in module_data["items"] if not item.get("_remove_after_simulation")]
-        self.save_config()
+            items = module_data["items"]
+            # Marks are set without a save, so read them directly rather than from a cached column
+            keep = [not item.get("_remove_after_simulation") for item in items]
+            if not all(keep):
+                module_data["items"] = list(compress(items, keep))
+                removed = True
+                next_id = module_data.get("next_id")
+                if next_id is not None:
+                    freed = {_item_number(item) for item, kept in zip(items, keep) if not kept}
+                    freed.difference_update(_item_number(item) for item in module_data["items"])
+                    while next_id - 1 in freed:
+                        next_id -= 1
+                    module_data["next_id"] = next_id
+        if removed:
+            self.save_config()
 
     def _convert_to_crc_format(self, event_type: str, event_data: dict) -> dict:
         """
         Converts the event data to the CRC event format (adds eventId, eventType, eventTimestamp, etc).
+        Copies a prebuilt per-type envelope, which is cheaper than building a new dict literal.
         """
-        return {
-            "eventId": str(uuid.uuid4()),
-            "eventType": event_type,
-            "eventTimestamp": datetime.now().isoformat() + "Z",
-            "data": event_data
-        }
+        template = self._crc_templates.get(event_type)
+        if template is None:
+            template = self._crc_templates[event_type] = {"eventId": None, "eventType": event_type, "eventTimestamp": None, "data": None}
+        event = template.copy()
+        event["eventId"] = _fast_uuid4()
+        event["eventTimestamp"] = _iso_ms(int(time.time() * 1000))  # Send time, never the batch snapshot
+        event["data"] = event_data
+        return event
 
     def _get_siem_alert_details(self, manual: bool = False) -> dict:
         """Generates details for a SIEM alert event."""
-        default_severity = self.alert_sources["SIEM_Alert"]["settings"].get("default_severity", "Medium")
-        possible_severities = ["Low", "Medium", "High", "Critical"]
+        fk = self._fake
+        _choice = random.choice
+        _randint = random.randint
+        _uniform = random.uniform
         if manual:
-            severity = input(f"Enter severity ({', '.join(possible_severities)}) [default: {default_severity}]: ").capitalize().strip()
-            if not severity or severity not in possible_severities:
-                logging.warning(f"Invalid or empty severity. Using default: {default_severity}.")
-                severity = default_severity
-            description = input("Enter description: ").strip() or f"Manual SIEM event on {datetime.now().isoformat()}"
-            user = input("Enter user: ").strip() or fake.user_name()
-            ip = input("Enter source IP address: ").strip() or fake.ipv4()
-            target_resource = input("Enter target resource: ").strip() or f"/api/v1/{fake.uri_path()}"
+            severity, description, user, ip, target_resource = self._prompt_siem_alert()
         else:
-            severity = random.choice(possible_severities)
-            description = fake.sentence(nb_words=10) + f" (Rule: {random.choice(['FW-Policy-Violation', 'Malware-Detected', 'Anomalous-Login', 'Data-Exfiltration'])})"
-            user = fake.user_name()
-            ip = fake.ipv4()
-            target_resource = f"/api/v1/{fake.uri_path()}/{random.choice(['users','data','config'])}"
+            severity = _choice(_SEVERITIES)
+            description = _sentence(10) + f" (Rule: {_choice(_SIEM_RULES)})"
+            user = fk.user_name()
+            ip = fk.ipv4()
+            target_resource = f"/api/v1/{fk.uri_path()}/{_choice(_SIEM_RESOURCE_KINDS)}"
         return {
             "source": "SIEM",
             "alertName": f"{severity} severity alert detected",
@@ -548,272 +1503,359 @@ class CRCSimulator:
             "description": description,
             "affectedUser": user,
             "sourceIP": ip,
-            "destinationIP": fake.ipv4(),
-            "protocol": random.choice(["TCP", "UDP", "ICMP"]),
-            "sourcePort": random.randint(1024, 65535),
-            "destinationPort": random.choice([80, 443, 22, 3389, 53, random.randint(1024, 65535)]),
-            "deviceAction": random.choice(["Allowed", "Blocked", "Logged", "Alerted"]),
+            "destinationIP": fk.ipv4(),
+            "protocol": _choice(_PROTOCOLS),
+            "sourcePort": _randint(1024, 65535),
+            "destinationPort": _destination_port(),
+            "deviceAction": _choice(_DEVICE_ACTIONS),
             "targetResource": target_resource,
-            "additionalInfo": {"rule_id": f"SIEM-{random.randint(1000,9999)}", "threat_score": round(random.uniform(0.1, 1.0), 2)}
+            "additionalInfo": {"rule_id": f"SIEM-{_randint(1000,9999)}", "threat_score": round(_uniform(0.1, 1.0), 2)}
         }
 
+    def _prompt_siem_alert(self) -> Tuple[str, str, str, str, str]:
+        """Ask for the user-chosen SIEM fields: severity, description, user, source IP, target."""
+        default_severity = self.alert_sources["SIEM_Alert"]["settings"].get("default_severity", "Medium")
+        fk = self._fake
+        severity = _normalize_choice(_prompt(f"Enter severity ({', '.join(_SEVERITIES)}) [default: {default_severity}]: "),
+                                     _SEVERITIES, default_severity, "severity")
+        description = _prompt("Enter description: ").strip() or f"Manual SIEM event on {_iso_now()}"
+        user = _prompt("Enter user: ").strip() or fk.user_name()
+        ip = _prompt("Enter source IP address: ").strip() or fk.ipv4()
+        target_resource = _prompt("Enter target resource: ").strip() or f"/api/v1/{fk.uri_path()}"
+        return severity, description, user, ip, target_resource
+
     def _get_login_alert_details(self, manual: bool = False) -> dict:
         """Generates details for a login alert event."""
-        default_status = self.alert_sources["Login_Alert"]["settings"].get("default_status", "Success")
-        possible_statuses = ["Success", "Failure"]
+        fk = self._fake
+        _choice = random.choice
+        _randint = random.randint
         if manual:
-            status = input(f"Enter status ({', '.join(possible_statuses)}) [default: {default_status}]: ").capitalize().strip()
-            if not status or status not in possible_statuses:
-                logging.warning(f"Invalid or empty status. Using default: {default_status}.")
-                status = default_status
-            user = input("Enter user: ").strip() or fake.user_name()
-            ip = input("Enter source IP address: ").strip() or fake.ipv4()
-            auth_method = input("Enter auth method (Password, MFA, SSO): ").strip() or "Password"
+            status, user, ip, auth_method = self._prompt_login_alert()
         else:
-            status = random.choices(possible_statuses, weights=[85, 15], k=1)[0]
-            user = fake.user_name()
-            ip = fake.ipv4()
-            auth_method = random.choice(["Password", "MFA", "SSO", "API Key"])
+            status = _weighted_choice(_LOGIN_STATUSES, _LOGIN_STATUS_CUM_WEIGHTS)
+            user = fk.user_name()
+            ip = fk.ipv4()
+            auth_method = _choice(_AUTH_METHODS)
         return {
             "source": "Authentication Service",
             "loginStatus": status,
             "username": user,
             "sourceIP": ip,
-            "userAgent": fake.user_agent(),
+            "userAgent": fk.user_agent(),
             "authenticationMethod": auth_method,
-            "failureReason": fake.sentence(nb_words=5) if status == "Failure" else None,
-            "loginTimestamp": (datetime.now() - timedelta(seconds=random.randint(1, 300))).isoformat() + "Z"
+            "failureReason": _sentence(5) if status == "Failure" else None,
+            "loginTimestamp": _iso_now(_randint(1, 300))
         }
 
+    def _prompt_login_alert(self) -> Tuple[str, str, str, str]:
+        """Ask for the user-chosen login fields: status, user, source IP, auth method."""
+        default_status = self.alert_sources["Login_Alert"]["settings"].get("default_status", "Success")
+        fk = self._fake
+        status = _normalize_choice(_prompt(f"Enter status ({', '.join(_LOGIN_STATUSES)}) [default: {default_status}]: "),
+                                   _LOGIN_STATUSES, default_status, "status")
+        user = _prompt("Enter user: ").strip() or fk.user_name()
+        ip = _prompt("Enter source IP address: ").strip() or fk.ipv4()
+        auth_method = _prompt("Enter auth method (Password, MFA, SSO): ").strip() or "Password"
+        return status, user, ip, auth_method
+
     def _get_smart_fence_alert_details(self, manual: bool = False) -> dict:
         """Generates details for a smart fence alert event."""
-        default_status = self.alert_sources["Smart_Fence_Alert"]["settings"].get("default_status", "Breached")
-        possible_statuses = ["Breached", "Secure", "Tamper Detected", "Low Battery"]
+        _choice = random.choice
+        _randint = random.randint
+        _uniform = random.uniform
         if manual:
-            location = input("Enter fence location/segment ID: ").strip() or f"Segment-{random.randint(100,999)}"
-            type_alert = input("Enter alert type (e.g., Climb, Cut, Tamper): ").strip() or "Climb"
-            status = input(f"Enter status ({', '.join(possible_statuses)}) [default: {default_status}]: ").strip() or default_status
-            if status not in possible_statuses: status = default_status
+            location, type_alert, status = self._prompt_smart_fence_alert()
         else:
-            location = f"{random.choice(['North Perimeter', 'East Gate', 'Warehouse Sector', 'Restricted Zone'])} Segment-{random.randint(100,999)}"
-            type_alert = random.choice(["Climb Attempt", "Fence Cut", "Tamper Detected", "Impact Detected", "Zone Entry"])
-            status = random.choices(possible_statuses, weights=[60, 30, 5, 5], k=1)[0]
+            location = f"{_choice(_FENCE_ZONES)} Segment-{_randint(100,999)}"
+            type_alert = _choice(_FENCE_ALERT_TYPES)
+            status = _weighted_choice(_FENCE_STATUSES, _FENCE_STATUS_CUM_WEIGHTS)
         return {
             "source": "Smart Fence Controller",
-            "fenceId": f"FNC-{random.randint(10,99)}",
+            "fenceId": f"FNC-{_randint(10,99)}",
             "segmentId": location,
             "alertType": type_alert,
             "status": status,
-            "detectionTimestamp": (datetime.now() - timedelta(seconds=random.randint(1, 120))).isoformat() + "Z",
-            "sensorData": {"vibration": round(random.uniform(0, 5.0), 2) if "Impact" in type_alert or "Tamper" in type_alert else 0,
-                           "voltage": round(random.uniform(11.5, 12.5), 2) if status != "Low Battery" else round(random.uniform(10.0, 11.0), 2)}
+            "detectionTimestamp": _iso_now(_randint(1, 120)),
+            "sensorData": {"vibration": round(_uniform(0, 5.0), 2) if "Impact" in type_alert or "Tamper" in type_alert else 0,
+                           "voltage": round(_uniform(11.5, 12.5), 2) if status != "Low Battery" else round(_uniform(10.0, 11.0), 2)}
         }
 
+    def _prompt_smart_fence_alert(self) -> Tuple[str, str, str]:
+        """Ask for the user-chosen fence fields: segment, alert type, status."""
+        default_status = self.alert_sources["Smart_Fence_Alert"]["settings"].get("default_status", "Breached")
+        location = _prompt("Enter fence location/segment ID: ").strip() or f"Segment-{random.randint(100,999)}"
+        type_alert = _prompt("Enter alert type (e.g., Climb, Cut, Tamper): ").strip() or "Climb"
+        status = _normalize_choice(_prompt(f"Enter status ({', '.join(_FENCE_STATUSES)}) [default: {default_status}]: "),
+                                   _FENCE_STATUSES, default_status)
+        return location, type_alert, status
+
     def _get_location_based_alert_details(self, manual: bool = False) -> dict:
         """Generates details for a location-based alert event."""
-        default_user = self.alert_sources["Location_Based_Alert"]["settings"].get("default_user", fake.user_name())
+        pool = self._faker_pool
+        _uniform = random.uniform
         if manual:
-            user = input(f"Enter user [default: {default_user}]: ").strip() or default_user
-            location_desc = input("Enter location description (e.g., Warehouse Floor): ").strip() or "Main Office"
-            latitude = input("Enter latitude: ").strip() or str(fake.latitude())
-            longitude = input("Enter longitude: ").strip() or str(fake.longitude())
-            event_trigger = input("Enter event trigger (e.g., Geofence Entry, Panic Button): ").strip() or "Geofence Entry"
+            user, location_desc, latitude, longitude, event_trigger = self._prompt_location_based_alert()
         else:
-            user = fake.user_name()
-            location_desc = f"{random.choice(['Building', 'Site', 'Area'])} {fake.word().capitalize()}"
-            latitude = str(fake.latitude())
-            longitude = str(fake.longitude())
-            event_trigger = random.choice(["Geofence Entry", "Geofence Exit", "Panic Button", "Man Down Alert", "Asset Movement"])
+            # Usernames and words come from the pre-filled pool; coordinates need no Faker at all.
+            user = pool.user_name()
+            location_desc = f"{random.choice(_LOCATION_KINDS)} {pool.word().capitalize()}"
+            latitude = f"{_uniform(-90, 90):.6f}"
+            longitude = f"{_uniform(-180, 180):.6f}"
+            event_trigger = random.choice(_LOCATION_TRIGGERS)
         return {
             "source": "Personnel Tracking System",
             "userId": user,
-            "deviceId": f"DEV-{random.randint(10000, 99999)}",
+            "deviceId": f"DEV-{random.randrange(10000, 100000)}",  # randrange skips randint's wrapper call
             "locationDescription": location_desc,
             "latitude": latitude,
             "longitude": longitude,
             "trigger": event_trigger,
-            "speed": round(random.uniform(0, 5.0), 1) if "Movement" in event_trigger else 0,
-            "altitude": round(random.uniform(50, 150), 1),
-            "accuracy": round(random.uniform(5, 50), 1)
+            "speed": round(_uniform(0, 5.0), 1) if "Movement" in event_trigger else 0,
+            "altitude": round(_uniform(50, 150), 1),
+            "accuracy": round(_uniform(5, 50), 1)
         }
 
+    def _prompt_location_based_alert(self) -> Tuple[str, str, str, str, str]:
+        """Ask for the user-chosen location fields: user, description, latitude, longitude, trigger."""
+        default_user = self.alert_sources["Location_Based_Alert"]["settings"].get("default_user") or self._faker_pool.user_name()
+        user = _prompt(f"Enter user [default: {default_user}]: ").strip() or default_user
+        location_desc = _prompt("Enter location description (e.g., Warehouse Floor): ").strip() or "Main Office"
+        latitude = _prompt("Enter latitude: ").strip() or f"{random.uniform(-90, 90):.6f}"
+        longitude = _prompt("Enter longitude: ").strip() or f"{random.uniform(-180, 180):.6f}"
+        event_trigger = _prompt("Enter event trigger (e.g., Geofence Entry, Panic Button): ").strip() or "Geofence Entry"
+        return user, location_desc, latitude, longitude, event_trigger
+
     def get_motion_sensor_alert_details(self, manual: bool = False) -> dict:
         """Generates details for a motion sensor alert event."""
-        default_status = self.alert_sources["Motion_Sensor_Alert"]["settings"].get("default_status", "Detected")
-        possible_statuses = ["Detected", "Clear"]
+        _choice = random.choice
+        _randint = random.randint
         if manual:
-            location = input("Enter sensor location: ").strip() or f"Room {random.randint(101, 599)}"
-            status = input(f"Enter status ({', '.join(possible_statuses)}) [default: {default_status}]: ").capitalize().strip()
-            if not status or status not in possible_statuses: status = default_status
-            timestamp_str = input("Enter timestamp (YYYY-MM-DDTHH:MM:SSZ): ").strip() or (datetime.now() - timedelta(seconds=random.randint(1, 180))).isoformat() + "Z"
+            location, status, timestamp_str = self._prompt_motion_sensor_alert()
         else:
-            location = f"{random.choice(['Corridor', 'Office', 'Entrance', 'Storage'])} {random.randint(1, 50)}"
-            status = random.choices(possible_statuses, weights=[70, 30], k=1)[0]
-            timestamp_str = (datetime.now() - timedelta(seconds=random.randint(1, 180))).isoformat() + "Z"
-        items = self.alert_sources["Motion_Sensor_Alert"]["items"]
-        item = next((item for item in items if item.get("location") == location), None)
+            location = f"{_choice(_MOTION_AREAS)} {_randint(1, 50)}"
+            status = _weighted_choice(_MOTION_STATUSES, _MOTION_STATUS_CUM_WEIGHTS)
+            timestamp_str = _iso_now(_randint(1, 180))
+        item = self._items_by_location("Motion_Sensor_Alert").get(location)
         if item:
             item["value"] = status
+            self._columns.pop("Motion_Sensor_Alert", None)
         else:
-            item_id_prefix = "MOT"
-            existing_ids = [int(item["id"].split("-")[1]) for item in items if item["id"].startswith(item_id_prefix)]
-            if existing_ids:
-                new_item_id = f"{item_id_prefix}-{max(existing_ids) + 1:03d}"
-            else:
-                new_item_id = f"{item_id_prefix}-001"
-            item = {"id": new_item_id, "name": f"Motion Sensor at {location}", "location": location, "value": status, "auto_generated": True}
-            items.append(item)
+            item = {"id": self._next_item_id("Motion_Sensor_Alert", "MOT"), "name": f"Motion Sensor at {location}", "location": location, "value": status, "auto_generated": True}
+            self._add_sensor_item("Motion_Sensor_Alert", item)
         return {
             "source": "PIR Motion Sensor",
             "itemId": item["id"],
             "location": item["location"],
             "status": item["value"],
             "detectionTimestamp": timestamp_str,
-            "sensitivityLevel": random.choice(["Low", "Medium", "High"])
+            "sensitivityLevel": _choice(_SENSITIVITY_LEVELS)
         }
 
+    def _prompt_motion_sensor_alert(self) -> Tuple[str, str, str]:
+        """Ask for the user-chosen motion sensor fields: location, status, timestamp."""
+        return self._prompt_sensor_alert("Motion_Sensor_Alert", _MOTION_STATUSES, f"Room {random.randint(101, 599)}")
+
     def _get_ir_sensor_alert_details(self, manual: bool = False) -> dict:
         """Generates details for an IR sensor alert event."""
-        default_status = self.alert_sources["IR_Sensor_Alert"]["settings"].get("default_status", "Detected")
-        possible_statuses = ["Detected", "Clear", "Obscured"]
+        _choice = random.choice
+        _randint = random.randint
+        _uniform = random.uniform
         if manual:
-            location = input("Enter sensor location: ").strip() or f"Doorway {random.randint(1, 20)}"
-            status = input(f"Enter status ({', '.join(possible_statuses)}) [default: {default_status}]: ").capitalize().strip()
-            if not status or status not in possible_statuses: status = default_status
-            timestamp_str = input("Enter timestamp (YYYY-MM-DDTHH:MM:SSZ): ").strip() or (datetime.now() - timedelta(seconds=random.randint(1, 180))).isoformat() + "Z"
+            location, status, timestamp_str = self._prompt_ir_sensor_alert()
         else:
-            location = f"{random.choice(['Main Gate', 'Window', 'Passageway', 'Secure Entry'])} {random.randint(1, 10)}"
-            status = random.choices(possible_statuses, weights=[65, 30, 5], k=1)[0]
-            timestamp_str = (datetime.now() - timedelta(seconds=random.randint(1, 180))).isoformat() + "Z"
-        items = self.alert_sources["IR_Sensor_Alert"]["items"]
-        item = next((item for item in items if item.get("location") == location), None)
+            location = f"{_choice(_IR_AREAS)} {_randint(1, 10)}"
+            status = _weighted_choice(_IR_STATUSES, _IR_STATUS_CUM_WEIGHTS)
+            timestamp_str = _iso_now(_randint(1, 180))
+        item = self._items_by_location("IR_Sensor_Alert").get(location)
         if item:
             item["value"] = status
+            self._columns.pop("IR_Sensor_Alert", None)
         else:
-            item_id_prefix = "IR"
-            existing_ids = [int(item["id"].split("-")[1]) for item in items if item["id"].startswith(item_id_prefix)]
-            if existing_ids:
-                new_item_id = f"{item_id_prefix}-{max(existing_ids) + 1:03d}"
-            else:
-                new_item_id = f"{item_id_prefix}-001"
-            item = {"id": new_item_id, "name": f"IR Sensor at {location}", "location": location, "value": status, "auto_generated": True}
-            items.append(item)
+            item = {"id": self._next_item_id("IR_Sensor_Alert", "IR"), "name": f"IR Sensor at {location}", "location": location, "value": status, "auto_generated": True}
+            self._add_sensor_item("IR_Sensor_Alert", item)
         return {
             "source": "IR Beam Sensor",
             "itemId": item["id"],
             "location": item["location"],
             "status": item["value"],
             "beamStatusTimestamp": timestamp_str,
-            "beamStrength": round(random.uniform(70.0, 100.0), 1) if status != "Obscured" else round(random.uniform(10.0, 50.0), 1)
+            "beamStrength": round(_uniform(70.0, 100.0), 1) if status != "Obscured" else round(_uniform(10.0, 50.0), 1)
         }
 
-def get_valid_event_types() -> List[str]:
-    """Returns a list of valid event types based on simulator methods."""
-    return [
-        "SIEM_Alert", "Login_Alert", "Smart_Fence_Alert",
-        "Location_Based_Alert", "Motion_Sensor_Alert", "IR_Sensor_Alert"
-    ]
+    def _prompt_ir_sensor_alert(self) -> Tuple[str, str, str]:
+        """Ask for the user-chosen IR sensor fields: location, status, timestamp."""
+        return self._prompt_sensor_alert("IR_Sensor_Alert", _IR_STATUSES, f"Doorway {random.randint(1, 20)}")
+
+    def _prompt_sensor_alert(self, source: str, statuses: Tuple[str, ...], default_location: str) -> Tuple[str, str, str]:
+        """Shared prompts of the motion and IR sensor events."""
+        default_status = self.alert_sources[source]["settings"].get("default_status", "Detected")
+        location = _prompt("Enter sensor location: ").strip() or default_location
+        status = _normalize_choice(_prompt(f"Enter status ({', '.join(statuses)}) [default: {default_status}]: "), statuses, default_status)
+        timestamp_str = _prompt("Enter timestamp (YYYY-MM-DDTHH:MM:SSZ): ").strip() or _iso_now(random.randint(1, 180))
+        return location, status, timestamp_str
+
+# Derived from the generator table so the two cannot drift apart
+_VALID_EVENT_TYPES = tuple(_EVENT_GENERATORS)
+
+# Parallel POSTs used by zero-delay automation runs against an API
+_AUTOMATION_CONCURRENCY = 8
+# Zero-delay automation runs with more events than this print one JSON line per event
+_COMPACT_OUTPUT_OVER = 10
+
+def get_valid_event_types() -> Tuple[str, ...]:
+    """Returns the valid event types based on simulator methods (a shared, immutable tuple)."""
+    return _VALID_EVENT_TYPES
+
+_MAIN_MENU = "\n".join((
+    "\n--- CRC Event Simulator ---",
+    "1. Manage Alert Sources",
+    "2. Manage Items",
+    "3. Manage Thresholds",
+    "4. Manage Settings",
+    "5. Simulate Event",
+    "6. Run Automation",
+    "7. Exit",
+))
 
 class SimulatorCLI:
     """Handles all CLI (user interface) logic for the simulator."""
     def __init__(self, simulator: CRCSimulator) -> None:
         self.simulator = simulator
+        # Main menu choice -> handler; '7' (exit) is handled by the loop itself
+        self._menu_actions: Dict[str, Callable[[], None]] = {
+            '1': simulator.manage_alert_sources,
+            '2': simulator.manage_items_for_module,
+            '3': simulator.manage_thresholds_for_alert_source,
+            '4': simulator.manage_settings_for_alert_source,
+            '5': self.simulate_event_menu,
+            '6': self.run_automation_menu,
+        }
 
     def main_menu(self) -> None:
         while True:
-            print("\n--- CRC Event Simulator ---")
-            print("1. Manage Alert Sources")
-            print("2. Manage Items")
-            print("3. Manage Thresholds")
-            print("4. Manage Settings")
-            print("5. Simulate Event")
-            print("6. Run Automation")
-            print("7. Exit")
-            choice = input("Enter your choice: ").strip()
-            if choice == '1':
-                self.simulator.manage_alert_sources()
-            elif choice == '2':
-                self.simulator.manage_items_for_module()
-            elif choice == '3':
-                self.simulator.manage_thresholds_for_module()
-            elif choice == '4':
-                self.simulator.manage_settings_for_alert_source()
-            elif choice == '5':
-                self.simulate_event_menu()
-            elif choice == '6':
-                self.run_automation_menu()
+            print(_MAIN_MENU)
+            choice = _prompt("Enter your choice: ").strip()
+            action = self._menu_actions.get(choice)
+            if action is not None:
+                action()
             elif choice == '7':
+                self.simulator.config_manager.flush(durable=True)
                 print("Exiting. Goodbye!")
                 break
             else:
                 print("Invalid choice. Please try again.")
 
     def simulate_event_menu(self) -> None:
-        sources = self.simulator.list_alert_sources()
+        sources = self.simulator.alert_source_names()
         print("\n--- Simulate Event ---")
-        for i, src in enumerate(sources):
-            print(f"{i+1}. {src}")
-        choice = input("Select event type (number or name, or 'back'): ").strip()
-        if choice.lower() == 'back':
+        print(_numbered_menu(sources))
+        event_type = _select_name(sources, "Select event type (number or name, or 'back'): ", "event type")
+        if event_type is None:
             return
-        try:
-            idx = int(choice) - 1
-            if 0 <= idx < len(sources):
-                event_type = sources[idx]
-            else:
-                print("Invalid number.")
-                return
-        except ValueError:
-            if choice in sources:
-                event_type = choice
-            else:
-                print("Invalid event type.")
-                return
-        manual = input("Manual input? (y/n): ").strip().lower() == 'y'
+        manual = _prompt("Manual input? (y/n): ").strip().lower() == 'y'
         self.simulator.simulate_event(event_type, manual)
 
     def run_automation_menu(self) -> None:
         print("\n--- Run Automation ---")
         try:
-            num_events = int(input("Number of events to generate: ").strip())
-            delay = float(input("Delay between events (seconds): ").strip())
+            num_events = int(_prompt("Number of events to generate: ").strip())
+            delay = float(_prompt("Delay between events (seconds): ").strip())
         except ValueError:
             print("Invalid input.")
             return
-        mode = input("Mode (random/type): ").strip().lower()
+        mode = _prompt("Mode (random/type): ").strip().lower()
         event_type = None
         if mode == 'type':
-            sources = self.simulator.list_alert_sources()
-            for i, src in enumerate(sources):
-                print(f"{i+1}. {src}")
-            choice = input("Select event type (number or name): ").strip()
-            try:
-                idx = int(choice) - 1
-                if 0 <= idx < len(sources):
-                    event_type = sources[idx]
-                else:
-                    print("Invalid number.")
-                    return
-            except ValueError:
-                if choice in sources:
-                    event_type = choice
+            sources = self.simulator.alert_source_names()
+            print(_numbered_menu(sources))
+            event_type = _select_name(sources, "Select event type (number or name): ", "event type")
+            if event_type is None:
+                return
+        if event_type and delay <= 0:
+            # Nothing to wait for between events: generate them as one batch, with pooled
+            # Faker values and buffered output. Auto-generated items are offered for keeping
+            # once, after the batch, rather than after every event.
+            # With an API to post to, overlap the POSTs with generating the next events
+            # An injected sender takes events one at a time
+            concurrent = self.simulator.crc_api_base_url and self.simulator.custom_sender is None
+            concurrency = _AUTOMATION_CONCURRENCY if concurrent else 1
+            self.simulator.simulate_events_batch(event_type, num_events, concurrency=concurrency, verbose=True,
+                                                 compact=num_events > _COMPACT_OUTPUT_OVER, review_items=True)
+            print(f"\nAutomation finished: {num_events} events generated.")
+            return
+        sources = self.simulator.alert_source_names()
+        # Without a delay nobody watches events one by one: buffer the output as batch runs do
+        buffered = self.simulator.buffered_output(compact=num_events > _COMPACT_OUTPUT_OVER) if delay <= 0 else nullcontext()
+        # POSTs go out from a worker thread, so neither the delay nor the prompts wait on them;
+        # Faker values come from the pools, as in batch runs
+        if delay > 0 and _interactive_stdin():
+            print("Type 'stop' and press Enter to end the run early.")
+        used_types = set()
+        with self.simulator.background_sending(), self.simulator.pooled_faker(), buffered:
+            for i in range(num_events):
+                et = event_type if event_type else random.choice(sources)
+                if delay > 0:
+                    sys.stdout.write(f"\n[Automation Event {i+1}/{num_events}]\n")  # One write, no flush per event
+                    self.simulator.simulate_event(et, manual=False)
                 else:
-                    print("Invalid event type.")
+                    # Prompting now would ask about events not printed yet: review after the run
+                    self.simulator.simulate_event(et, manual=False, review_items=False)
+                    used_types.add(et)
+                if delay > 0 and i + 1 < num_events and _wait_for_stop(delay):
+                    print(f"\nAutomation stopped after {i+1} of {num_events} events.")
                     return
-        for i in range(num_events):
-            et = event_type if event_type else random.choice(self.simulator.list_alert_sources())
-            print(f"\n[Automation Event {i+1}/{num_events}]")
-            self.simulator.simulate_event(et, manual=False)
-            if delay > 0:
-                time.sleep(delay)
+        if used_types:
+            self.simulator.review_auto_generated_items(sorted(used_types))
         print("\nAutomation finished.")
 
-def main() -> None:
-    """Main function to run the event simulator console interface."""
-    crc_api_url_input = input("Enter the CRC API base URL (e.g., http://localhost:8080, leave empty to print only): ").strip()
-    simulator = CRCSimulator(crc_api_base_url=crc_api_url_input or None)
+def _positive_int(text: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{text}'")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return value
+
+def _build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="CRC event simulator. Without a command, starts the interactive menu.")
+    parser.add_argument("--api-url", help="CRC API base URL; events are only printed when omitted")
+    parser.add_argument("--config", default="config.json", help="configuration file (default: config.json)")
+    parser.add_argument("--seed", type=int, help="seed for reproducible events")
+    commands = parser.add_subparsers(dest="command")
+    simulate = commands.add_parser("simulate", help="generate and send events of one type, then exit")
+    simulate.add_argument("event_type", choices=get_valid_event_types())
+    simulate.add_argument("--count", type=_positive_int, default=1, help="number of events (default: 1)")
+    simulate.add_argument("--concurrency", type=_positive_int, default=_AUTOMATION_CONCURRENCY,
+                          help=f"parallel POSTs when an API URL is set (default: {_AUTOMATION_CONCURRENCY})")
+    simulate.add_argument("--bulk", action="store_true", help="send through the bulk endpoint")
+    simulate.add_argument("--compact", action="store_true", help="print one JSON line per event")
+    simulate.add_argument("--quiet", action="store_true", help="do not print events")
+    simulate.add_argument("--ndjson", metavar="PATH", help="also append events to a newline-delimited JSON file")
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Main function to run the event simulator console interface, or a single command given on the command line."""
+    args = _build_arg_parser().parse_args(argv)
+    if args.command == "simulate":
+        # Scripted run: no prompts at all
+        simulator = CRCSimulator(crc_api_base_url=args.api_url, config_file=args.config, seed=args.seed)
+        with simulator.ndjson_sink(args.ndjson) if args.ndjson else nullcontext():
+            simulator.simulate_events_batch(args.event_type, args.count, concurrency=args.concurrency,
+                                            verbose=not args.quiet, bulk=args.bulk, compact=args.compact)
+        simulator.config_manager.flush(durable=True)
+        simulator.close()
+        return
+    crc_api_url_input = args.api_url
+    if crc_api_url_input is None:
+        crc_api_url_input = _prompt("Enter the CRC API base URL (e.g., http://localhost:8080, leave empty to print only): ").strip()
+    simulator = CRCSimulator(crc_api_base_url=crc_api_url_input or None, config_file=args.config, seed=args.seed)
     cli = SimulatorCLI(simulator)
-    cli.main_menu()
+    try:
+        cli.main_menu()
+    finally:
+        simulator.close()
 
 if __name__ == "__main__":
     main()
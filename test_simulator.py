@@ -1,5 +1,19 @@
+import io
+import json
+import os
+import sys
+import uuid
+from pathlib import Path
 import pytest
-from simulator import CRCSimulator
+import simulator
+from simulator import (CRCSimulator, FakerPool, SimulatorCLI, _COMMON_PORTS, _convert_setting, _destination_port,
+                       _fast_uuid4, _frozen_clock, _iso_now, _lorem_words, _match_setting, _normalize_choice,
+                       _parse_fields, _parse_number, _read_json_file, _select_name, _sentence, _weighted_choice,
+                       fake, main)
+
+@pytest.fixture
+def sim(tmp_path):
+    return CRCSimulator(config_file=str(tmp_path / "test_config.json"))
 
 def test_add_and_remove_alert_source(tmp_path):
     sim = CRCSimulator(config_file=str(tmp_path / "test_config.json"))
@@ -75,9 +89,639 @@ def test_manage_thresholds(tmp_path):
         sim.validate_field_value("TestSource", "num", "11")
 
 def test_simulate_event(tmp_path):
-    sim = CRCSimulator(config_file=str(tmp_path / "test_config.json"))
-    sim.add_alert_source("TestSource", ["fieldA"])
+    sent = []
     # הוספת פונקציה דמה לסימולציה
-    sim._get_siem_alert_details = lambda manual=False: {"fieldA": "val"}
-    sim.send_event = lambda event_type, event_data: event_data.update({"sent": True})
+    sim = CRCSimulator(config_file=str(tmp_path / "test_config.json"),
+                       providers={"SIEM_Alert": lambda manual=False: {"fieldA": "val"}},
+                       sender=lambda event_type, event_data: sent.append((event_type, event_data)))
+    sim.add_alert_source("TestSource", ["fieldA"])
     sim.simulate_event("SIEM_Alert", manual=False)
+    assert sent == [("SIEM_Alert", {"fieldA": "val"})]
+
+def test_batched_saves_write_once(tmp_path):
+    config_path = tmp_path / "test_config.json"
+    sim = CRCSimulator(config_file=str(config_path))
+    with sim.config_manager.batched():
+        sim.add_alert_source("TestSource", ["fieldA"])
+        # Nothing is written until the batch ends
+        assert "TestSource" not in config_path.read_text()
+        sim.alert_sources["TestSource"]["settings"]["foo"] = "bar"
+        sim.save_config()
+    assert '"foo"' in config_path.read_text()
+
+def test_add_item_ids_use_counter(sim, monkeypatch):
+    sim.add_alert_source("TestSource", ["fieldA"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": "val")
+    sim.add_item_to_source("TestSource")
+    sim.add_item_to_source("TestSource")
+    ids = [item["id"] for item in sim.alert_sources["TestSource"]["items"]]
+    assert ids == ["TES-001", "TES-002"]
+    assert sim.alert_sources["TestSource"]["next_id"] == 3
+    assert sim.alert_sources["TestSource"]["id_prefix"] == "TES"
+
+def test_item_id_counter_derived_from_existing_items(sim):
+    sim.alert_sources["Legacy"] = {"fields": [], "thresholds": {}, "settings": {},
+                                   "items": [{"id": "LEG-004"}, {"id": "LEG-002"}]}
+    assert sim._next_item_id("Legacy", "LEG") == "LEG-005"
+    assert sim._next_item_id("Legacy", "LEG") == "LEG-006"
+
+def test_simulate_events_batch(sim):
+    events = sim.simulate_events_batch("Motion_Sensor_Alert", 5)
+    assert len(events) == 5
+    assert all(ev["eventType"] == "Motion_Sensor_Alert" for ev in events)
+    # Sensor items created during the batch are not kept
+    assert sim.alert_sources["Motion_Sensor_Alert"]["items"] == []
+    with pytest.raises(ValueError):
+        sim.simulate_events_batch("NoSuchAlert", 1)
+
+def test_faker_pool_reuses_values():
+    pool = FakerPool(fake, size=3)
+    values = {pool.user_name() for _ in range(50)}
+    assert len(values) <= 3
+
+def test_search_items_in_source(sim, monkeypatch, capsys):
+    sim.add_alert_source("TestSource", ["name"])
+    sim.alert_sources["TestSource"]["items"] += [{"id": "TES-001", "name": "Front Door"},
+                                                 {"id": "TES-002", "name": "Back Door"}]
+    monkeypatch.setattr("builtins.input", lambda prompt="": "front")
+    sim.search_items_in_source("TestSource")
+    assert "Found 1 matching items" in capsys.readouterr().out
+    sim.alert_sources["TestSource"]["items"][1]["name"] = "Front Gate"
+    sim.save_config()
+    sim.search_items_in_source("TestSource")
+    assert "Found 2 matching items" in capsys.readouterr().out
+
+class _RecordingSession:
+    def __init__(self):
+        self.posts = []
+
+    def post(self, url, data=None, timeout=None):
+        self.posts.append((url, data))
+        return type("Response", (), {"status_code": 200, "raise_for_status": lambda self: None})()
+
+def test_send_event_posts_through_session(sim):
+    sim.crc_api_base_url = "http://crc.test"
+    sim._session = _RecordingSession()
+    sim.send_event("SIEM_Alert", {"fieldA": "val"})
+    sim.send_event("SIEM_Alert", {"fieldA": "val2"})
+    assert [url for url, _ in sim._session.posts] == ["http://crc.test/events"] * 2
+    assert b'"fieldA":"val"' in sim._session.posts[0][1]
+
+def test_simulate_events_batch_concurrent_posts(sim):
+    sim.crc_api_base_url = "http://crc.test"
+    sim._session = _RecordingSession()
+    events = sim.simulate_events_batch("Login_Alert", 20, concurrency=4)
+    assert len(sim._session.posts) == 20
+    assert {ev["eventId"] for ev in events} == {json.loads(data)["eventId"] for _, data in sim._session.posts}
+
+def test_simulate_events_batch_output(sim, capsys):
+    sim.simulate_events_batch("SIEM_Alert", 3)
+    assert "Event Generated" not in capsys.readouterr().out
+    sim.simulate_events_batch("SIEM_Alert", 3, verbose=True)
+    assert capsys.readouterr().out.count("Event Generated (SIEM_Alert)") == 3
+    assert sim.verbose
+
+def test_fast_uuid4_is_valid_v4():
+    for _ in range(100):
+        value = uuid.UUID(_fast_uuid4())
+        assert value.version == 4 and value.variant == uuid.RFC_4122
+
+def test_save_config_replaces_file_atomically(tmp_path):
+    config_path = tmp_path / "test_config.json"
+    sim = CRCSimulator(config_file=str(config_path))
+    sim.add_alert_source("TestSource", ["fieldA"])
+    assert "TestSource" in json.loads(config_path.read_text())["alert_sources"]
+    assert [p.name for p in tmp_path.iterdir()] == ["test_config.json"]
+
+def test_validate_field_value_list_and_exact_thresholds(sim):
+    sim.add_alert_source("TestSource", ["color", "mode", "other"])
+    sim.alert_sources["TestSource"]["thresholds"].update({"color": ["red", "green"], "mode": "auto"})
+    sim.save_config()
+    assert sim.validate_field_value("TestSource", "color", "red")
+    assert sim.validate_field_value("TestSource", "mode", "auto")
+    assert sim.validate_field_value("TestSource", "other", "x")
+    with pytest.raises(ValueError, match="one of: red, green"):
+        sim.validate_field_value("TestSource", "color", "blue")
+    with pytest.raises(ValueError, match="exactly: auto"):
+        sim.validate_field_value("TestSource", "mode", "manual")
+    with pytest.raises(ValueError, match="cannot be empty"):
+        sim.validate_field_value("TestSource", "other", "")
+
+def test_validate_field_value_list_threshold_with_unhashable_entries(sim):
+    sim.add_alert_source("TestSource", ["shape"])
+    sim.alert_sources["TestSource"]["thresholds"]["shape"] = ["round", ["nested"]]
+    sim.save_config()
+    assert sim.validate_field_value("TestSource", "shape", "round")
+    with pytest.raises(ValueError, match="one of"):
+        sim.validate_field_value("TestSource", "shape", "square")
+
+def test_list_items_by_module_pages(sim, monkeypatch, capsys):
+    sim.add_alert_source("TestSource", ["fieldA"])
+    sim.alert_sources["TestSource"]["items"] += [{"id": f"TES-{i:03d}", "fieldA": i} for i in range(1, 26)]
+    answers = iter(["n", ""])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+    sim.list_items_by_module("TestSource")
+    out = capsys.readouterr().out
+    assert "-- Page 1/2 --" in out and "-- Page 2/2 --" in out
+    assert out.count("ID: TES-") == 25
+
+def test_motion_sensor_reuses_item_by_location(sim, monkeypatch):
+    items = sim.alert_sources["Motion_Sensor_Alert"]["items"]
+    items[:] = [{"id": "MOT-007", "name": "old", "location": "Corridor 1", "value": "Clear"}]
+    sim.alert_sources["Motion_Sensor_Alert"].pop("next_id", None)
+    monkeypatch.setattr("builtins.input", lambda _: "n")
+    monkeypatch.setattr("random.choice", lambda seq: seq[0])
+    monkeypatch.setattr("random.randint", lambda a, b: a)
+    sim.get_motion_sensor_alert_details()
+    assert len(items) == 1
+    items[0]["location"] = "Corridor 2"
+    sim._location_index.clear()
+    sim.get_motion_sensor_alert_details()
+    assert [item["id"] for item in items] == ["MOT-007", "MOT-008"]
+
+def test_weighted_choice_follows_cumulative_weights(monkeypatch):
+    values = ("a", "b", "c")
+    cum_weights = (65, 95, 100)
+    for draw, expected in ((0.0, "a"), (0.649, "a"), (0.65, "b"), (0.949, "b"), (0.95, "c"), (0.9999, "c")):
+        monkeypatch.setattr("random.random", lambda draw=draw: draw)
+        assert _weighted_choice(values, cum_weights) == expected
+
+def test_run_automation_uses_batch_without_delay(sim, monkeypatch):
+    calls = []
+    monkeypatch.setattr(sim, "simulate_events_batch", lambda et, n, **kw: calls.append((et, n, kw)) or [])
+    answers = iter(["5", "0", "type", "SIEM_Alert"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+    SimulatorCLI(sim).run_automation_menu()
+    assert calls == [("SIEM_Alert", 5, {"concurrency": 1, "verbose": True, "compact": False, "review_items": True})]
+    sim.crc_api_base_url = "http://crc.test"
+    answers = iter(["5", "0", "type", "SIEM_Alert"])
+    SimulatorCLI(sim).run_automation_menu()
+    assert calls[-1] == ("SIEM_Alert", 5, {"concurrency": 8, "verbose": True, "compact": False, "review_items": True})
+
+def test_item_id_counter_skips_unnumbered_ids(sim):
+    sim.add_alert_source("TestSource", ["fieldA"])
+    source = sim.alert_sources["TestSource"]
+    source["items"] = [{"id": "legacy"}, {"id": "TES-abc"}, {"id": "X-Y-041"}, {"id": "TES-007"}]
+    del source["next_id"]
+    assert sim._next_item_id("TestSource") == "TES-042"
+    assert sim._next_item_id("TestSource") == "TES-043"
+
+def test_iso_now_uses_frozen_clock(monkeypatch):
+    monkeypatch.setattr("time.time", lambda: 1_700_000_000.0)
+    with _frozen_clock():
+        monkeypatch.setattr("time.time", lambda: 1_700_000_500.0)
+        assert _iso_now() == "2023-11-14T22:13:20.000Z"
+        assert _iso_now(60) == "2023-11-14T22:12:20.000Z"
+    assert _iso_now() == "2023-11-14T22:21:40.000Z"
+
+def test_seeded_simulators_generate_same_events(tmp_path):
+    runs = []
+    for name in ("a.json", "b.json"):
+        sim = CRCSimulator(config_file=str(tmp_path / name), seed=1234)
+        runs.append([event["data"] for event in sim.simulate_events_batch("SIEM_Alert", 5)])
+    assert runs[0] == runs[1]
+
+def test_main_menu_dispatches_choices(sim, monkeypatch, capsys):
+    cli = SimulatorCLI(sim)
+    calls = []
+    cli._menu_actions['6'] = lambda: calls.append('6')
+    answers = iter(["6", "x", "3", "back", "7"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+    cli.main_menu()
+    out = capsys.readouterr().out
+    assert calls == ['6']
+    assert "Invalid choice" in out
+    assert "1. SIEM_Alert" in out
+    assert "Goodbye" in out
+
+def test_manual_login_alert_uses_prompted_values(sim, monkeypatch):
+    answers = iter(["failure", "alice", "10.0.0.1", "MFA"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+    data = sim._get_login_alert_details(manual=True)
+    assert (data["loginStatus"], data["username"], data["sourceIP"], data["authenticationMethod"]) == ("Failure", "alice", "10.0.0.1", "MFA")
+    assert data["failureReason"]
+
+def test_normalize_choice_ignores_case_and_spaces():
+    statuses = ("Breached", "Secure", "Tamper Detected", "Low Battery")
+    assert _normalize_choice("  low battery ", statuses, "Breached") == "Low Battery"
+    assert _normalize_choice("SECURE", statuses, "Breached") == "Secure"
+    assert _normalize_choice("", statuses, "Breached") == "Breached"
+    assert _normalize_choice("melted", statuses, "Breached") == "Breached"
+
+def test_read_json_file_reuses_bytes_until_file_changes(tmp_path, monkeypatch):
+    path = tmp_path / "data.json"
+    path.write_text('{"a": 1}')
+    first = _read_json_file(path)
+    reads = []
+    original = type(path).read_bytes
+    monkeypatch.setattr(type(path), "read_bytes", lambda self: reads.append(self) or original(self))
+    second = _read_json_file(path)
+    assert first == second == {"a": 1} and first is not second
+    assert reads == []
+    path.write_text('{"a": 22}')
+    assert _read_json_file(path) == {"a": 22}
+    assert reads == [path]
+
+def test_destination_port_draws_high_port_only_when_picked(monkeypatch):
+    monkeypatch.setattr("random.randint", lambda a, b: pytest.fail("high port drawn"))
+    monkeypatch.setattr("random.randrange", lambda n: 1)
+    assert _destination_port() == _COMMON_PORTS[1]
+    monkeypatch.setattr("random.randrange", lambda n: n - 1)
+    monkeypatch.setattr("random.randint", lambda a, b: 40000)
+    assert _destination_port() == 40000
+
+def test_simulate_events_batch_bulk_posts(sim, monkeypatch):
+    monkeypatch.setattr("simulator._BULK_CHUNK", 4)
+    sim.crc_api_base_url = "http://crc.test"
+    sim._session = _RecordingSession()
+    events = sim.simulate_events_batch("SIEM_Alert", 10, bulk=True)
+    assert [url for url, _ in sim._session.posts] == ["http://crc.test/events/bulk"] * 3
+    sent = [event for _, body in sim._session.posts for event in json.loads(body)["events"]]
+    assert [event["eventId"] for event in sent] == [event["eventId"] for event in events]
+
+def test_simulate_events_batch_compact_output(sim, capsys):
+    events = sim.simulate_events_batch("Login_Alert", 3, verbose=True, compact=True)
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)["eventId"] for line in lines] == [event["eventId"] for event in events]
+    assert sim._compact_output is False
+
+def test_sentence_uses_lorem_words():
+    text = _sentence(5)
+    words = text[:-1].split(" ")
+    known = {word.lower() for word in _lorem_words()}
+    assert text.endswith(".") and text[0].isupper()
+    assert len(words) == 5 and {word.lower() for word in words} <= known
+
+def test_background_sending_posts_in_order(sim):
+    sim.crc_api_base_url = "http://crc.test"
+    sim._session = _RecordingSession()
+    with sim.background_sending():
+        sent = [sim.send_event("SIEM_Alert", {"n": n}) for n in range(5)]
+    assert sim._sender is None
+    assert [json.loads(body)["eventId"] for _, body in sim._session.posts] == [event["eventId"] for event in sent]
+
+def test_pooled_faker_restores_previous_generator(sim):
+    original = sim._fake
+    with sim.pooled_faker():
+        assert sim._fake is sim._faker_pool
+        with sim.pooled_faker():
+            pass
+        assert sim._fake is sim._faker_pool
+    assert sim._fake is original
+
+def test_send_event_prints_event_block(sim, capsys):
+    event = sim.send_event("SIEM_Alert", {"fieldA": "val"})
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "-" * 20 + " Event Generated (SIEM_Alert) " + "-" * 20
+    assert lines[-1] == "-" * 52
+    assert json.loads("\n".join(lines[1:-1])) == event
+
+def test_fast_uuid4_pool_refills_without_repeats():
+    values = {_fast_uuid4() for _ in range(5000)}
+    assert len(values) == 5000
+
+def test_compact_batch_encodes_each_event_once(sim, monkeypatch, capsys):
+    sim.crc_api_base_url = "http://crc.test"
+    sim._session = _RecordingSession()
+    compact_dumps = []
+    original = simulator._json_dumps
+
+    def recording_dumps(obj, indent=True):
+        if not indent:
+            compact_dumps.append(obj)
+        return original(obj, indent)
+
+    monkeypatch.setattr(simulator, "_json_dumps", recording_dumps)
+    events = sim.simulate_events_batch("Login_Alert", 4, verbose=True, compact=True)
+    assert compact_dumps == events
+    printed = [line.encode() for line in capsys.readouterr().out.splitlines() if line.startswith("{")]
+    assert [body for _, body in sim._session.posts] == printed
+
+def test_ndjson_sink_writes_one_line_per_event(sim, tmp_path):
+    out = tmp_path / "events.ndjson"
+    with sim.ndjson_sink(str(out)):
+        events = sim.simulate_events_batch("IR_Sensor_Alert", 3)
+        sim.send_event("SIEM_Alert", {"fieldA": "val"})
+    assert sim._sink is None
+    lines = out.read_text().splitlines()
+    assert [json.loads(line)["eventId"] for line in lines[:3]] == [event["eventId"] for event in events]
+    assert json.loads(lines[3])["data"] == {"fieldA": "val"}
+
+def test_reload_after_save_uses_written_bytes(tmp_path, monkeypatch):
+    config_path = tmp_path / "test_config.json"
+    sim = CRCSimulator(config_file=str(config_path))
+    sim.add_alert_source("TestSource", ["fieldA"])
+    monkeypatch.setattr(Path, "read_bytes", lambda self: pytest.fail("config re-read from disk"))
+    reloaded = CRCSimulator(config_file=str(config_path))
+    assert "TestSource" in reloaded.alert_sources
+
+def test_prompt_reads_piped_stdin_directly(monkeypatch, capsys):
+    piped = io.StringIO("1\nback\n")
+    monkeypatch.setattr(sys, "stdin", piped)
+    monkeypatch.setattr(sys, "__stdin__", piped)
+    monkeypatch.setattr("builtins.input", lambda prompt="": pytest.fail("input() used for piped stdin"))
+    assert simulator._prompt("Choice: ") == "1"
+    assert simulator._prompt("Choice: ") == "back"
+    with pytest.raises(EOFError):
+        simulator._prompt("Choice: ")
+    assert capsys.readouterr().out == "Choice: " * 3
+
+def test_simulate_event_menu_lists_sources_numbered(sim, monkeypatch, capsys):
+    monkeypatch.setattr("builtins.input", lambda prompt="": "back")
+    SimulatorCLI(sim).simulate_event_menu()
+    lines = capsys.readouterr().out.splitlines()
+    names = sim.alert_source_names()
+    assert lines[-len(names):] == [f"{i}. {name}" for i, name in enumerate(names, 1)]
+
+def test_select_name_by_number_or_name(monkeypatch, capsys):
+    names = ("Alpha", "Beta")
+    answers = iter(["2", "Alpha", "3", "Gamma", "back"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+    assert _select_name(names, "> ", "alert source name") == "Beta"
+    assert _select_name(names, "> ", "alert source name") == "Alpha"
+    assert _select_name(names, "> ", "alert source name") is None
+    assert _select_name(names, "> ", "alert source name") is None
+    assert _select_name(names, "> ", "alert source name") is None
+    assert capsys.readouterr().out.splitlines() == ["Invalid number.", "Invalid alert source name."]
+
+def test_convert_setting_keeps_current_type():
+    assert _convert_setting(True, "No") is False
+    assert _convert_setting(False, "yes") is True
+    assert _convert_setting(3, "42") == 42
+    assert _convert_setting(0.5, "1.25") == 1.25
+    assert _convert_setting(3, "many") == "many"
+    assert _convert_setting(True, "ture") == "ture"
+    assert _convert_setting(True, "maybe") == "maybe"
+    assert _convert_setting("a", "b") == "b"
+
+def test_set_threshold_recompiles_validator(sim):
+    sim.add_alert_source("TestSource", ["num"])
+    sim.set_threshold("TestSource", "num", {"min": 1, "max": 10})
+    assert sim.validate_field_value("TestSource", "num", "5")
+    sim.set_threshold("TestSource", "num", {"min": 6, "max": 10})
+    with pytest.raises(ValueError):
+        sim.validate_field_value("TestSource", "num", "5")
+    sim.remove_threshold("TestSource", "num")
+    assert sim.validate_field_value("TestSource", "num", "5")
+    with pytest.raises(ValueError):
+        sim.remove_threshold("TestSource", "num")
+
+def test_run_automation_random_without_delay_buffers_output(sim, monkeypatch, capsys):
+    writes = []
+    monkeypatch.setattr(simulator, "_write_stdout", writes.append)
+    answers = iter(["3", "0", "random"])
+    # Any auto-generated item is not kept
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(answers, "n"))
+    SimulatorCLI(sim).run_automation_menu()
+    out = capsys.readouterr().out
+    assert "[Automation Event" not in out
+    assert len(writes) == 1 and writes[0].count(b" Event Generated (") == 3
+
+def test_json_dumps_stdlib_fallback_matches_json(monkeypatch):
+    monkeypatch.setattr(simulator, "orjson", None)
+    obj = {"a": [1, 2.5, None], "b": {"c": "d"}}
+    assert simulator._json_dumps(obj) == json.dumps(obj, indent=2).encode()
+    assert simulator._json_dumps(obj, indent=False) == json.dumps(obj, separators=(",", ":")).encode()
+    assert simulator._json_loads(simulator._json_dumps(obj)) == obj
+
+def test_save_skips_write_when_config_unchanged(sim, monkeypatch):
+    sim.add_alert_source("TestSource", ["fieldA"])
+    replaced = []
+    real_replace = os.replace
+    monkeypatch.setattr(os, "replace", lambda src, dst: replaced.append(dst) or real_replace(src, dst))
+    sim.save_config()
+    assert replaced == []
+    sim.alert_sources["TestSource"]["settings"]["foo"] = "bar"
+    sim.save_config()
+    assert len(replaced) == 1
+    assert not sim.config_manager._dirty
+
+def test_settings_menu_lists_settings_then_actions(sim, monkeypatch, capsys):
+    sim.add_alert_source("TestSource", ["fieldA"])
+    sim.alert_sources["TestSource"]["settings"].update({"foo": "bar", "n": 3})
+    monkeypatch.setattr("builtins.input", lambda prompt="": "b")
+    sim._settings_menu("TestSource")
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[:4] == ["", "--- Settings for 'TestSource' ---", "1. foo: bar", "2. n: 3"]
+    assert lines[4] == "a. Add Setting"
+
+def test_match_setting_ignores_case():
+    settings = {"Threshold": 1, "mode": "auto"}
+    assert _match_setting(settings, "mode") == "mode"
+    assert _match_setting(settings, "THRESHOLD") == "Threshold"
+    assert _match_setting(settings, "missing") is None
+
+def test_main_simulate_command_runs_without_prompts(tmp_path, monkeypatch):
+    monkeypatch.setattr("builtins.input", lambda prompt="": pytest.fail("prompted in a scripted run"))
+    out = tmp_path / "events.ndjson"
+    main(["--config", str(tmp_path / "test_config.json"), "--seed", "1",
+          "simulate", "SIEM_Alert", "--count", "3", "--quiet", "--ndjson", str(out)])
+    events = [json.loads(line) for line in out.read_bytes().splitlines()]
+    assert [event["eventType"] for event in events] == ["SIEM_Alert"] * 3
+
+def test_parse_fields_strips_and_drops_blanks_and_repeats():
+    assert _parse_fields(" a, b ,, a,c ") == ["a", "b", "c"]
+    assert _parse_fields(" , ") == []
+
+def test_wait_for_stop_returns_when_stop_is_typed(monkeypatch):
+
+    class FakeTerminal(io.StringIO):
+        def isatty(self):
+            return True
+
+    terminal = FakeTerminal("hello\nstop\n")
+    monkeypatch.setattr(sys, "stdin", terminal)
+    monkeypatch.setattr(sys, "__stdin__", terminal)
+    monkeypatch.setattr(simulator.os, "name", "posix")
+    monkeypatch.setattr(simulator.select, "select", lambda r, w, x, timeout: (r, [], []))
+    assert simulator._wait_for_stop(60) is True
+    assert terminal.read() == ""
+
+def test_close_releases_http_session(sim):
+    sim.crc_api_base_url = "http://crc.test"
+    session = sim._http_session()
+    assert sim._http_session() is session
+    sim.close()
+    assert sim._session is None
+    assert sim._http_session() is not session
+    sim.close()
+
+def test_bulk_batch_posts_each_chunk_once_complete(tmp_path, monkeypatch):
+    monkeypatch.setattr("simulator._BULK_CHUNK", 4)
+    posts_seen = []
+    sim = CRCSimulator(crc_api_base_url="http://crc.test", config_file=str(tmp_path / "test_config.json"),
+                       providers={"SIEM_Alert": lambda manual=False: posts_seen.append(len(sim._session.posts)) or {}})
+    sim._session = _RecordingSession()
+    sim.simulate_events_batch("SIEM_Alert", 10, bulk=True, verbose=False)
+    assert posts_seen == [0] * 4 + [1] * 4 + [2] * 2
+    assert len(sim._session.posts) == 3
+
+def test_range_check_parses_repeated_values_once(sim):
+    sim.add_alert_source("TestSource", ["num"])
+    sim.set_threshold("TestSource", "num", {"min": 1, "max": 10})
+    _parse_number.cache_clear()
+    for _ in range(3):
+        with pytest.raises(ValueError, match="must be a number"):
+            sim.validate_field_value("TestSource", "num", "abc")
+        assert sim.validate_field_value("TestSource", "num", "5")
+    assert _parse_number.cache_info().misses == 2
+
+def test_only_pooled_faker_is_unweighted(sim):
+    assert sim._fake is simulator.fake
+    assert sim._faker_pool._faker is simulator._pool_fake
+    assert simulator.fake.factories[0].providers[0].__use_weighting__
+    assert not simulator._pool_fake.factories[0].providers[0].__use_weighting__
+
+def test_direct_threshold_edits_apply_after_save(sim):
+    sim.add_alert_source("TestSource", ["num"])
+    sim.set_threshold("TestSource", "num", {"min": 1, "max": 10})
+    assert sim.validate_field_value("TestSource", "num", "5")
+    sim.alert_sources["TestSource"]["thresholds"]["num"]["min"] = 6
+    # Compiled checkers are reused until a save drops them
+    assert sim.validate_field_value("TestSource", "num", "5")
+    sim.save_config()
+    with pytest.raises(ValueError):
+        sim.validate_field_value("TestSource", "num", "5")
+
+def test_edit_item_rejected_value_leaves_item_unchanged(sim, monkeypatch, capsys):
+    sim.add_alert_source("TestSource", ["name", "num"])
+    sim.set_threshold("TestSource", "num", {"min": 1, "max": 10})
+    sim.alert_sources["TestSource"]["items"].append({"id": "TES-001", "name": "Front", "num": "5"})
+    answers = iter(["1", "Back", "99"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+    sim.edit_item_in_source("TestSource")
+    assert sim.alert_sources["TestSource"]["items"][0] == {"id": "TES-001", "name": "Front", "num": "5"}
+    assert "must be between" in capsys.readouterr().out
+    answers = iter(["1", "Back", "7"])
+    sim.edit_item_in_source("TestSource")
+    assert sim.alert_sources["TestSource"]["items"][0] == {"id": "TES-001", "name": "Back", "num": "7"}
+    assert sim._item_column("TestSource", "name") == ["Back"]
+
+def test_prompt_flushes_before_reading_piped_stdin(monkeypatch):
+    events = []
+
+    class RecordingStdout(io.StringIO):
+        def write(self, text):
+            events.append("write")
+            return super().write(text)
+
+        def flush(self):
+            events.append("flush")
+
+    class RecordingStdin(io.StringIO):
+        def readline(self, *args):
+            events.append("read")
+            return super().readline(*args)
+
+    piped = RecordingStdin("1\n")
+    monkeypatch.setattr(sys, "stdin", piped)
+    monkeypatch.setattr(sys, "__stdin__", piped)
+    monkeypatch.setattr(sys, "stdout", RecordingStdout())
+    assert simulator._prompt("Choice: ") == "1"
+    assert events == ["write", "flush", "read"]
+
+@pytest.mark.parametrize("option", [["--count", "-2"], ["--count", "0"], ["--concurrency", "0"], ["--count", "x"]])
+def test_main_simulate_rejects_non_positive_counts(tmp_path, capsys, option):
+    with pytest.raises(SystemExit) as exc:
+        main(["--config", str(tmp_path / "test_config.json"), "simulate", "SIEM_Alert", *option])
+    assert exc.value.code == 2
+    assert "usage:" in capsys.readouterr().err
+
+def test_run_automation_type_batch_offers_auto_items_after_output(sim, monkeypatch):
+    sim.alert_sources["Motion_Sensor_Alert"]["items"] = []
+    log = []
+    monkeypatch.setattr(simulator, "_write_stdout", lambda data: log.append("events"))
+    answers = iter(["3", "0", "type", "Motion_Sensor_Alert"])
+
+    def answer(prompt=""):
+        log.append(prompt)
+        return next(answers, "y")
+
+    monkeypatch.setattr("builtins.input", answer)
+    SimulatorCLI(sim).run_automation_menu()
+    reviews = [i for i, entry in enumerate(log) if "save this item as permanent" in entry]
+    assert reviews and log.index("events") < reviews[0]
+    items = sim.alert_sources["Motion_Sensor_Alert"]["items"]
+    assert len(items) == len(reviews)
+    assert not any("auto_generated" in item for item in items)
+
+def test_run_automation_random_without_delay_reviews_items_after_output(sim, monkeypatch, capsys):
+    for source in ("Motion_Sensor_Alert", "IR_Sensor_Alert"):
+        sim.alert_sources[source]["items"] = []
+    monkeypatch.setattr(sim, "alert_source_names", lambda: ("Motion_Sensor_Alert", "IR_Sensor_Alert"))
+    piped = io.StringIO("4\n0\nrandom\n" + "n\n" * 8)
+    monkeypatch.setattr(sys, "stdin", piped)
+    monkeypatch.setattr(sys, "__stdin__", piped)
+    SimulatorCLI(sim).run_automation_menu()
+    out = capsys.readouterr().out
+    first_review = out.index("save this item as permanent")
+    assert out.count(" Event Generated (") == 4
+    assert out.rindex(" Event Generated (") < first_review
+    assert sim.alert_sources["Motion_Sensor_Alert"]["items"] == []
+    assert sim.alert_sources["IR_Sensor_Alert"]["items"] == []
+
+def test_discarded_auto_items_give_their_ids_back(sim, monkeypatch):
+    source = sim.alert_sources["Motion_Sensor_Alert"]
+    source["items"] = [{"id": "MOT-004", "name": "kept", "location": "Lobby", "value": "Clear"}]
+    source["next_id"] = 5
+    sim.simulate_events_batch("Motion_Sensor_Alert", 50)
+    assert source["next_id"] == 5
+    assert json.loads(sim.config_manager.config_file.read_text())["alert_sources"]["Motion_Sensor_Alert"]["next_id"] == 5
+    answers = iter(["y", "n"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(answers, "n"))
+    for location in ("Hall A", "Hall B"):
+        sim._add_sensor_item("Motion_Sensor_Alert", {"id": sim._next_item_id("Motion_Sensor_Alert", "MOT"),
+                                                     "location": location, "value": "Clear", "auto_generated": True})
+    sim.review_auto_generated_items(["Motion_Sensor_Alert"])
+    assert [item["id"] for item in source["items"]] == ["MOT-004", "MOT-005"]
+    assert source["next_id"] == 6
+
+def test_injected_sender_receives_batch_events(tmp_path, monkeypatch):
+    sent = []
+    sim = CRCSimulator(config_file=str(tmp_path / "test_config.json"),
+                       sender=lambda event_type, event_data: sent.append(event_type) or event_data)
+    events = sim.simulate_events_batch("SIEM_Alert", 3)
+    assert sent == ["SIEM_Alert"] * 3 and len(events) == 3
+    sim.crc_api_base_url = "http://crc.test"
+    with pytest.raises(ValueError, match="injected sender"):
+        sim.simulate_events_batch("SIEM_Alert", 3, concurrency=4)
+    with pytest.raises(ValueError, match="injected sender"):
+        sim.simulate_events_batch("SIEM_Alert", 3, bulk=True)
+    answers = iter(["2", "0", "type", "SIEM_Alert"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+    SimulatorCLI(sim).run_automation_menu()
+    assert sent == ["SIEM_Alert"] * 5
+
+def test_thresholds_menu_sets_and_removes_thresholds(sim, monkeypatch, capsys):
+    sim.add_alert_source("TestSource", ["num", "color", "mode"])
+    answers = iter(["s", "num", "r", "1", "10",
+                    "s", "color", "l", "red, green",
+                    "s", "mode", "e", "auto",
+                    "s", "num", "r", "9", "2",
+                    "s", "other",
+                    "d", "mode",
+                    "d", "mode",
+                    "b"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+    sim._thresholds_menu("TestSource")
+    assert sim.alert_sources["TestSource"]["thresholds"] == {"num": {"min": 1, "max": 10}, "color": ["red", "green"]}
+    with pytest.raises(ValueError):
+        sim.validate_field_value("TestSource", "num", "11")
+    out = capsys.readouterr().out
+    assert "1. num: 1 to 10" in out and "2. color: one of red, green" in out and "3. mode: exactly auto" in out
+    assert "Minimum cannot be greater than maximum." in out
+    assert "Unknown field." in out and "Threshold not found." in out
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_fast_uuid4_differs_across_fork():
+    _fast_uuid4()  # Make sure the parent holds a filled pool
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.write(write_end, _fast_uuid4().encode())
+        os._exit(0)
+    os.close(write_end)
+    os.waitpid(pid, 0)
+    with os.fdopen(read_end) as pipe:
+        child = pipe.read()
+    assert child and child != _fast_uuid4()